@@ -45,6 +45,7 @@ class Config:
         
         if not self.ADMIN_IDS:
             raise ValueError("At least one ADMIN_ID is required in environment variables")
+        self._admin_set = frozenset(self.ADMIN_IDS)
         
         # Database Configuration
         self.DATABASE_PATH = os.getenv("DATABASE_PATH", "bot_data.db")
@@ -83,6 +84,7 @@ class Config:
         # Batch processing settings
         self.BATCH_SIZE = int(os.getenv('BATCH_SIZE', '50'))
         self.MAX_ACCOUNTS_PER_OPERATION = int(os.getenv('MAX_ACCOUNTS_PER_OPERATION', '100'))
+        self.MAX_CONCURRENT_ACCOUNTS = int(os.getenv('MAX_CONCURRENT_ACCOUNTS', '10'))
         
         # Resource management
         self.CLIENT_CLEANUP_INTERVAL = int(os.getenv('CLIENT_CLEANUP_INTERVAL', '300'))  # 5 minutes
@@ -91,4 +93,4 @@ class Config:
     
     def is_admin(self, user_id: int) -> bool:
         """Check if user is an admin"""
-        return user_id in self.ADMIN_IDS
+        return user_id in self._admin_set
@@ -6,8 +6,10 @@ import aiosqlite
 import asyncio
 import json
 import logging
+import time
+from collections import namedtuple
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,8 @@ class LogType(Enum):
     FLOOD_WAIT = "flood_wait"
     LIVE_JOIN = "live_join"
 
+ChannelControlRow = namedtuple("ChannelControlRow", "channel_link status reason added_by created_at")
+
 class DatabaseManager:
     """Manages SQLite database operations"""
     
@@ -33,6 +37,13 @@ class DatabaseManager:
         self.db_path = db_path
         self._operation_lock = asyncio.Lock()
         self._connection = None
+        
+        # Fire-and-forget log rows, group-committed by a background writer
+        self.log_queue: asyncio.Queue = asyncio.Queue()
+        self._log_writer_task: Optional[asyncio.Task] = None
+        
+        # (monotonic ts, count) memo for the account-count screens; dropped on account writes
+        self._active_count_cache: Optional[Tuple[float, int]] = None
     
     async def init_db(self):
         """Initialize database with required tables"""
@@ -153,6 +164,8 @@ class DatabaseManager:
             await db.execute("CREATE INDEX IF NOT EXISTS idx_channels_user ON channels (user_id)")
             await db.execute("CREATE INDEX IF NOT EXISTS idx_logs_type ON logs (type)")
             await db.execute("CREATE INDEX IF NOT EXISTS idx_logs_created ON logs (created_at)")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_logs_user_type_created ON logs (user_id, type, created_at DESC)")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_logs_channel_type_created ON logs (channel_id, type, created_at DESC)")
             await db.execute("CREATE INDEX IF NOT EXISTS idx_premium_settings_user ON premium_settings (user_id)")
             await db.execute("CREATE INDEX IF NOT EXISTS idx_channel_control_status ON channel_control (status)")
             await db.execute("CREATE INDEX IF NOT EXISTS idx_live_monitoring_user ON live_monitoring (user_id)")
@@ -263,6 +276,7 @@ class DatabaseManager:
                     WHERE phone = ? OR session_name = ?
                 """, (username, AccountStatus.ACTIVE.value, phone, session_name))
                 await self._commit_with_lock()
+                self._active_count_cache = None
                 display_name = username if username else phone
                 await self.log_action(LogType.JOIN, message=f"Account {display_name} updated successfully")
                 return True
@@ -273,6 +287,7 @@ class DatabaseManager:
                     VALUES (?, ?, ?, ?)
                 """, (phone, username, session_name, AccountStatus.ACTIVE.value))
                 await self._commit_with_lock()
+                self._active_count_cache = None
                 display_name = username if username else phone
                 await self.log_action(LogType.JOIN, message=f"Account {display_name} added successfully")
                 return True
@@ -285,6 +300,7 @@ class DatabaseManager:
         try:
             await self._execute_with_lock("DELETE FROM accounts WHERE phone = ?", (phone,))
             await self._commit_with_lock()
+            self._active_count_cache = None
             await self.log_action(LogType.JOIN, message=f"Account {phone} removed")
             return True
         except Exception as e:
@@ -320,6 +336,63 @@ class DatabaseManager:
             logger.error(f"Error getting accounts: {e}")
             return []
     
+    async def get_account_by_id(self, account_id: int) -> Optional[Dict[str, Any]]:
+        """Get a single account by its id"""
+        try:
+            async with self._operation_lock:
+                connection = await self._ensure_connection()
+                async with connection.execute("""
+                    SELECT id, phone, username, session_name, status, flood_wait_until, 
+                           created_at, last_used, failed_attempts
+                    FROM accounts WHERE id = ? LIMIT 1
+                """, (account_id,)) as cursor:
+                    row = await cursor.fetchone()
+                    if row:
+                        return {
+                            "id": row[0],
+                            "phone": row[1],
+                            "username": row[2],
+                            "session_name": row[3],
+                            "status": row[4],
+                            "flood_wait_until": row[5],
+                            "created_at": row[6],
+                            "last_used": row[7],
+                            "failed_attempts": row[8]
+                        }
+                    return None
+        except Exception as e:
+            logger.error(f"Error getting account {account_id}: {e}")
+            return None
+    
+    async def get_accounts_by_status(self, status: str) -> List[Dict[str, Any]]:
+        """Get accounts with the given status"""
+        try:
+            async with self._operation_lock:
+                connection = await self._ensure_connection()
+                async with connection.execute("""
+                    SELECT id, phone, username, session_name, status, flood_wait_until, 
+                           created_at, last_used, failed_attempts
+                    FROM accounts WHERE status = ? ORDER BY created_at
+                """, (status,)) as cursor:
+                    rows = await cursor.fetchall()
+                    return [
+                        {
+                            "id": row[0],
+                            "phone": row[1],
+                            "username": row[2],
+                            "session_name": row[3],
+                            "status": row[4],
+                            "flood_wait_until": row[5],
+                            "created_at": row[6],
+                            "last_used": row[7],
+                            "failed_attempts": row[8]
+                        }
+                        for row in rows
+                    ]
+        except Exception as e:
+            logger.error(f"Error getting {status} accounts: {e}")
+            return []
+    
     async def get_active_accounts(self) -> List[Dict[str, Any]]:
         """Get only active accounts that can be used"""
         try:
@@ -352,8 +425,11 @@ class DatabaseManager:
             logger.error(f"Error getting active accounts: {e}")
             return []
     
-    async def get_active_account_count(self) -> int:
-        """Get count of active accounts available for use"""
+    async def get_active_account_count(self, ttl: float = 30.0) -> int:
+        """Get count of active accounts available for use, memoised for ttl seconds"""
+        cached = self._active_count_cache
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
         try:
             now = datetime.now()
             async with self._operation_lock:
@@ -363,7 +439,9 @@ class DatabaseManager:
                     WHERE status = ? AND (flood_wait_until IS NULL OR flood_wait_until < ?)
                 """, (AccountStatus.ACTIVE.value, now)) as cursor:
                     result = await cursor.fetchone()
-                    return result[0] if result else 0
+                    count = result[0] if result else 0
+            self._active_count_cache = (time.monotonic(), count)
+            return count
         except Exception as e:
             logger.error(f"Error getting active account count: {e}")
             return 0
@@ -378,6 +456,7 @@ class DatabaseManager:
                 WHERE id = ?
             """, (status.value, flood_wait_until, account_id))
             await self._commit_with_lock()
+            self._active_count_cache = None
             return True
         except Exception as e:
             logger.error(f"Error updating account {account_id} status: {e}")
@@ -411,6 +490,48 @@ class DatabaseManager:
             logger.error(f"Error adding channel {channel_link} for user {user_id}: {e}")
             return False
     
+    async def get_channel(self, user_id: int, channel_id: int) -> Optional[Dict[str, Any]]:
+        """Get one consolidated channel for a user by its id"""
+        try:
+            async with self._operation_lock:
+                connection = await self._ensure_connection()
+                async with connection.execute("""
+                    SELECT 
+                        MIN(c.id) as id,
+                        c.channel_link, 
+                        c.channel_id, 
+                        c.title, 
+                        c.member_count,
+                        MIN(c.created_at) as created_at, 
+                        MAX(c.last_boosted) as last_boosted, 
+                        SUM(c.total_boosts) as total_boosts,
+                        COUNT(*) as account_count
+                    FROM channels c
+                    JOIN channels target ON target.id = ? AND target.user_id = ?
+                    WHERE c.user_id = target.user_id
+                      AND c.channel_link = target.channel_link
+                      AND c.channel_id IS target.channel_id
+                    GROUP BY c.channel_link, c.channel_id
+                    LIMIT 1
+                """, (channel_id, user_id)) as cursor:
+                    row = await cursor.fetchone()
+                    if row:
+                        return {
+                            "id": row[0],
+                            "channel_link": row[1],
+                            "channel_id": row[2],
+                            "title": row[3],
+                            "member_count": row[4],
+                            "created_at": row[5],
+                            "last_boosted": row[6],
+                            "total_boosts": row[7] or 0,
+                            "account_count": row[8]
+                        }
+                    return None
+        except Exception as e:
+            logger.error(f"Error getting channel {channel_id} for user {user_id}: {e}")
+            return None
+    
     async def get_user_channels(self, user_id: int) -> List[Dict[str, Any]]:
         """Get unique channels for a user (consolidated from all accounts)"""
         try:
@@ -450,6 +571,25 @@ class DatabaseManager:
             logger.error(f"Error getting channels for user {user_id}: {e}")
             return []
     
+    async def get_user_channel_totals(self, user_id: int) -> Tuple[int, int]:
+        """Get the unique channel count and total boosts for a user without loading the channels"""
+        try:
+            async with self._operation_lock:
+                connection = await self._ensure_connection()
+                # Count channels the same way get_user_channels groups them
+                async with connection.execute("""
+                    SELECT COUNT(*), COALESCE(SUM(boosts), 0) FROM (
+                        SELECT SUM(total_boosts) AS boosts FROM channels
+                        WHERE user_id = ?
+                        GROUP BY channel_link, channel_id
+                    )
+                """, (user_id,)) as cursor:
+                    row = await cursor.fetchone()
+                    return row[0], row[1]
+        except Exception as e:
+            logger.error(f"Error getting channel totals for user {user_id}: {e}")
+            return 0, 0
+    
     async def get_channel_accounts(self, user_id: int, channel_link: str) -> List[Dict[str, Any]]:
         """Get all accounts that joined a specific channel"""
         try:
@@ -520,8 +660,72 @@ class DatabaseManager:
             logger.error(f"Error logging action: {e}")
             return False
     
-    async def get_logs(self, limit: int = 100, log_type: Optional[LogType] = None) -> List[Dict[str, Any]]:
-        """Get recent logs"""
+    def enqueue_log(self, log_type: LogType, account_id: Optional[int] = None,
+                    channel_id: Optional[int] = None, user_id: Optional[int] = None, message: Optional[str] = None):
+        """Queue a log row for the background writer without waiting on the database"""
+        self.log_queue.put_nowait((log_type, account_id, channel_id, user_id, message))
+        if self._log_writer_task is None or self._log_writer_task.done():
+            self._log_writer_task = asyncio.create_task(self._log_writer_loop())
+    
+    async def _log_writer_loop(self, max_batch: int = 256, max_wait: float = 0.1):
+        """Drain queued log rows in batches of up to max_batch or every max_wait seconds"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            row = await self.log_queue.get()
+            if row is None:
+                return
+            batch = [row]
+            deadline = loop.time() + max_wait
+            while len(batch) < max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self.log_queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    # Shutdown sentinel: write what we have, then exit
+                    stopping = True
+                    break
+                batch.append(row)
+            await self.log_actions_bulk(batch)
+    
+    async def flush_logs(self):
+        """Write any queued log rows and stop the background writer"""
+        if self._log_writer_task and not self._log_writer_task.done():
+            self.log_queue.put_nowait(None)
+            await self._log_writer_task
+        self._log_writer_task = None
+        batch = []
+        while not self.log_queue.empty():
+            row = self.log_queue.get_nowait()
+            if row is not None:
+                batch.append(row)
+        await self.log_actions_bulk(batch)
+    
+    async def log_actions_bulk(self, rows: List[Tuple[LogType, Optional[int], Optional[int], Optional[int], Optional[str]]]) -> bool:
+        """Log several (log_type, account_id, channel_id, user_id, message) rows in one transaction"""
+        if not rows:
+            return True
+        try:
+            async with self._operation_lock:
+                connection = await self._ensure_connection()
+                await connection.executemany("""
+                    INSERT INTO logs (type, account_id, channel_id, user_id, message)
+                    VALUES (?, ?, ?, ?, ?)
+                """, [(log_type.value, account_id, channel_id, user_id, message)
+                      for log_type, account_id, channel_id, user_id, message in rows])
+                await connection.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Error logging {len(rows)} actions: {e}")
+            return False
+    
+    async def get_logs(self, limit: int = 100, log_type: Optional[LogType] = None,
+                       user_id: Optional[int] = None, channel_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get recent logs, optionally narrowed to one user and/or channel"""
         try:
             query = """
                 SELECT l.id, l.type, l.message, l.created_at,
@@ -533,11 +737,20 @@ class DatabaseManager:
                 LEFT JOIN accounts a ON l.account_id = a.id
                 LEFT JOIN channels c ON l.channel_id = c.id
             """
+            conditions = []
             params = []
             
             if log_type:
-                query += " WHERE l.type = ?"
+                conditions.append("l.type = ?")
                 params.append(log_type.value)
+            if user_id is not None:
+                conditions.append("l.user_id = ?")
+                params.append(user_id)
+            if channel_id is not None:
+                conditions.append("l.channel_id = ?")
+                params.append(channel_id)
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
             
             query += " ORDER BY l.created_at DESC LIMIT ?"
             params.append(limit)
@@ -563,6 +776,44 @@ class DatabaseManager:
             logger.error(f"Error getting logs: {e}")
             return []
     
+    async def get_user_stats(self, user_id: int, log_type: LogType = LogType.BOOST, limit: int = 3) -> Dict[str, Any]:
+        """Get channel totals, top channels and recent activity for a user"""
+        stats = {"channel_count": 0, "total_boosts": 0, "top_channels": [], "recent_logs": []}
+        try:
+            async with self._operation_lock:
+                connection = await self._ensure_connection()
+                # Same grouping as get_user_channels, so duplicate rows count once
+                async with connection.execute("""
+                    SELECT COUNT(*), COALESCE(SUM(boosts), 0) FROM (
+                        SELECT SUM(total_boosts) AS boosts FROM channels
+                        WHERE user_id = ?
+                        GROUP BY channel_link, channel_id
+                    )
+                """, (user_id,)) as cursor:
+                    row = await cursor.fetchone()
+                    stats["channel_count"], stats["total_boosts"] = row[0], row[1]
+                async with connection.execute("""
+                    SELECT title, channel_link, SUM(total_boosts) AS boosts FROM channels
+                    WHERE user_id = ?
+                    GROUP BY channel_link, channel_id
+                    ORDER BY boosts DESC LIMIT ?
+                """, (user_id, limit)) as cursor:
+                    stats["top_channels"] = [
+                        {"title": row[0], "channel_link": row[1], "total_boosts": row[2]}
+                        for row in await cursor.fetchall()
+                    ]
+                async with connection.execute("""
+                    SELECT created_at, message FROM logs
+                    WHERE user_id = ? AND type = ? ORDER BY created_at DESC LIMIT ?
+                """, (user_id, log_type.value, limit)) as cursor:
+                    stats["recent_logs"] = [
+                        {"created_at": row[0], "message": row[1]}
+                        for row in await cursor.fetchall()
+                    ]
+        except Exception as e:
+            logger.error(f"Error getting stats for user {user_id}: {e}")
+        return stats
+    
     async def get_user_count(self) -> int:
         """Get total user count"""
         try:
@@ -603,7 +854,7 @@ class DatabaseManager:
             await connection.commit()
             logger.info(f"Channel {channel_link} blacklisted by admin {admin_id}")
     
-    async def get_channel_control_lists(self) -> Dict[str, List[Dict[str, Any]]]:
+    async def get_channel_control_lists(self) -> Dict[str, List[ChannelControlRow]]:
         """Get whitelist and blacklist"""
         async with self._operation_lock:
             connection = await self._ensure_connection()
@@ -615,10 +866,9 @@ class DatabaseManager:
             rows = await cursor.fetchall()
             
             lists = {"whitelisted": [], "blacklisted": []}
-            for row in rows:
-                row_dict = dict(row)
-                if row_dict["status"] in lists:
-                    lists[row_dict["status"]].append(row_dict)
+            for row in map(ChannelControlRow._make, rows):
+                if row.status in lists:
+                    lists[row.status].append(row)
             
             return lists
     
@@ -791,8 +1041,24 @@ class DatabaseManager:
             logger.error(f"Error updating user settings: {e}")
             return False
     
+    async def update_user_setting(self, user_id: int, key: str, value: Any) -> bool:
+        """Set one key in a user's settings JSON in place, without reading the row first"""
+        try:
+            async with self._operation_lock:
+                connection = await self._ensure_connection()
+                cursor = await connection.execute(
+                    "UPDATE users SET settings = json_set(COALESCE(NULLIF(settings, ''), '{}'), '$.' || ?, json(?)) WHERE id = ?",
+                    (key, json.dumps(value), user_id)
+                )
+                await connection.commit()
+                return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"Error updating setting {key} for user {user_id}: {e}")
+            return False
+    
     async def close(self):
         """Close database connection"""
+        await self.flush_logs()
         if self._connection:
             await self._connection.close()
             self._connection = None
@@ -3,22 +3,203 @@ Admin handlers for the Telegram View Booster Bot
 Handles account management, logs, and system monitoring
 """
 import asyncio
+import hashlib
+import html
 import logging
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from aiogram import Bot, types
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 
 from config import Config
-from database import DatabaseManager, LogType
+from database import AccountStatus, DatabaseManager, LogType
 from session_manager import TelethonManager
 from inline_keyboards import BotKeyboards
-from helpers import Utils
+from helpers import Utils, truncate
+from handlers.base import HandlerBase
 
 logger = logging.getLogger(__name__)
 
+_API_HASH_RE = re.compile(r'^[0-9a-fA-F]{32}$')
+
+_LOG_TYPE_MAP = {
+    "logs_all": None,
+    "logs_join": LogType.JOIN,
+    "logs_boost": LogType.BOOST,
+    "logs_error": LogType.ERROR,
+    "logs_ban": LogType.BAN,
+    "logs_flood_wait": LogType.FLOOD_WAIT
+}
+_LOG_LABELS = {
+    "logs_all": "All",
+    "logs_join": "Join",
+    "logs_boost": "Boost",
+    "logs_error": "Error",
+    "logs_ban": "Ban",
+    "logs_flood_wait": "Flood Wait"
+}
+
+_KB_ACCOUNT_MGMT = BotKeyboards.account_management()
+_KB_CANCEL = BotKeyboards.cancel_operation()
+_KB_LOG_TYPES = BotKeyboards.log_types()
+_KB_CHANNEL_CONTROL = BotKeyboards.channel_control()
+_KB_BACK_MAIN_MENU = BotKeyboards.back_button("main_menu")
+_KB_BACK_ADMIN_LOGS = BotKeyboards.back_button("admin_logs")
+_KB_BACK_LIST_ACCOUNTS = BotKeyboards.back_button("list_accounts")
+_KB_BACK_CHANNEL_CONTROL = BotKeyboards.back_button("admin_channel_control")
+_KB_API_CHOICE = types.InlineKeyboardMarkup(inline_keyboard=[
+    [types.InlineKeyboardButton(text="🔹 Use Default API", callback_data="api_default")],
+    [types.InlineKeyboardButton(text="🔸 Use Custom API", callback_data="api_custom")],
+    [types.InlineKeyboardButton(text="❌ Cancel", callback_data="cancel_operation")]
+])
+
+_ADD_ACCOUNT_TEXT = """
+➕ **Add New Account**
+
+Choose API credentials to use:
+
+🔹 **Default API** (Recommended)
+• Quick and easy setup
+• Uses system default credentials
+• API ID: {api_id}
+
+🔸 **Custom API** (Advanced)
+• Use your own API credentials
+• Get from https://my.telegram.org
+• More control and privacy
+
+Choose your preferred method:
+        """
+
+_USE_CUSTOM_API_TEXT = """
+🔸 **Custom API Setup**
+
+📋 **Step 1: Get Your API Credentials**
+
+1️⃣ Visit https://my.telegram.org
+2️⃣ Login with your phone number
+3️⃣ Go to "API Development Tools"
+4️⃣ Create a new app:
+   • App title: Any name (e.g., "My Bot")
+   • Short name: Any short name
+   • Platform: Other
+   • Description: Optional
+
+5️⃣ Copy your credentials:
+   • **api_id** (number)
+   • **api_hash** (32-character string)
+
+📱 **Step 2: Send Your API ID**
+
+Please send your **API ID** (numbers only):
+Example: 12345678
+
+Or /cancel to abort.
+        """
+
+_LOGS_MENU_TEXT = """
+📊 **System Logs**
+
+Choose log type to view:
+• All Logs - Complete activity log
+• Joins - Channel join activities
+• Boosts - View boosting operations
+• Errors - System errors and failures
+• Bans - Account ban notifications
+• Flood Waits - Rate limiting events
+        """
+
+_ACCOUNT_MGMT_TEXT = """
+📱 **Account Management**
+
+Total Accounts: {total}
+
+Quick Actions:
+• Add Account - Login with phone number
+• List Accounts - View all accounts with status
+• Remove Account - Delete account and session
+• Refresh Status - Update account health
+        """
+
+_DEFAULT_API_TEXT = """
+📱 **Add Account - Default API**
+
+Using default API credentials:
+• API ID: {api_id}
+• API Hash: {api_hash_prefix}...
+
+Please send the phone number for the new account.
+
+📋 **Format examples:**
+• +1234567890
+• +44 123 456 7890
+• 1234567890
+
+⚠️ **Requirements:**
+• Phone number has Telegram registered
+• Access to SMS/calls for verification
+• 2FA password ready (if enabled)
+
+Send the phone number or /cancel to abort.
+        """
+
+_REFRESH_STATUS_TEXT = """
+🔄 **Account Status Refreshed**
+
+📊 **Current Status:**
+✅ Active: {active}
+🚫 Banned: {banned}
+⏳ Flood Wait: {flood_wait}
+❌ Inactive: {inactive}
+
+Last updated: {updated}
+        """
+
+_CHANNEL_CONTROL_TEXT = """
+🎯 <b>Channel Control Center</b>
+
+┌──── 📊 <b>Security Status</b> ────┐
+│ Whitelisted: {whitelist_count} channels
+│ Blacklisted: {blacklist_count} channels
+│ Protection Level: Active
+└────────────────────────────────┘
+
+🛡️ <b>Control Options:</b>
+• ✅ <b>Whitelist Channel</b> - Allow priority access
+• ❌ <b>Blacklist Channel</b> - Block completely
+• 📋 <b>View Lists</b> - Review all entries
+• 🗑️ <b>Remove Entry</b> - Clean up lists
+
+🚨 <b>Security Actions Available Below</b>
+        """
+
+_NO_ACCOUNTS_HEALTH_TEXT = """
+⚡ **Account Health Report**
+
+📊 **Overview:**
+Total Accounts: 0
+
+❌ No accounts configured yet.
+
+🔧 **Recommendations:**
+• Add accounts from the account management menu
+        """
+
+_EMPTY_CHANNEL_LISTS_TEXT = """
+📋 <b>Channel Control Lists</b>
+
+✅ <b>Whitelisted Channels</b> (0):
+• No whitelisted channels
+
+❌ <b>Blacklisted Channels</b> (0):
+• No blacklisted channels
+"""
+
 class AdminStates(StatesGroup):
     waiting_for_phone = State()
     waiting_for_remove_phone = State()
@@ -31,14 +212,81 @@ class AdminStates(StatesGroup):
     waiting_for_channel_reason = State()
     waiting_for_remove_channel = State()
 
-class AdminHandler:
+class AdminHandler(HandlerBase):
     """Handles admin-specific operations"""
     
+    # Callback data -> handler method name
+    # (user stats and premium management removed for personal use)
+    _STATIC_ROUTES = {
+        "admin_accounts": "show_account_management",
+        "admin_logs": "show_logs_menu",
+        "admin_failed": "show_failed_operations",
+        "admin_banned": "show_banned_accounts",
+        "admin_health": "show_account_health",
+        "admin_channel_control": "show_channel_control",
+        "add_account": "start_add_account",
+        "remove_account": "start_remove_account",
+        "list_accounts": "list_accounts",
+        "refresh_accounts": "refresh_account_status",
+        "api_default": "use_default_api",
+        "api_custom": "use_custom_api",
+        "cancel_operation": "cancel_operation",
+        "channel_whitelist": "start_channel_whitelist",
+        "channel_blacklist": "start_channel_blacklist",
+        "channel_lists": "show_channel_lists",
+        "channel_remove": "start_channel_remove",
+    }
+    # Routes whose handlers also take the FSM context
+    _STATE_ROUTES = frozenset({
+        "add_account", "remove_account", "api_default", "api_custom", "cancel_operation",
+        "channel_whitelist", "channel_blacklist", "channel_remove",
+    })
+    # Prefix routes receive the raw callback data
+    _PREFIX_ROUTES = (
+        ("logs_", "show_filtered_logs"),
+        ("account_details:", "show_account_details"),
+    )
+    # FSM state name -> text message handler name, resolved at class creation
+    # (premium management states removed for personal use)
+    _MSG_ROUTES = {
+        AdminStates.waiting_for_phone.state: "process_add_account",
+        AdminStates.waiting_for_remove_phone.state: "process_remove_account",
+        AdminStates.waiting_for_custom_api_id.state: "process_custom_api_id",
+        AdminStates.waiting_for_custom_api_hash.state: "process_custom_api_hash",
+        AdminStates.waiting_for_verification_code.state: "process_verification_code",
+        AdminStates.waiting_for_2fa_password.state: "process_2fa_password",
+        AdminStates.waiting_for_channel_link.state: "process_channel_link",
+        AdminStates.waiting_for_channel_reason.state: "process_channel_reason",
+        AdminStates.waiting_for_remove_channel.state: "process_remove_channel",
+    }
+    
     def __init__(self, config: Config, db_manager: DatabaseManager, telethon_manager: TelethonManager):
         self.config = config
         self.db = db_manager
         self.telethon = telethon_manager
         self.bot: Optional[Bot] = None  # Will be set by the main bot class
+        self._last_render: "OrderedDict[Tuple[int, int], tuple]" = OrderedDict()  # (chat_id, message_id) -> (text digest, rendered text)
+        self._bg_tasks: set = set()  # Fire-and-forget Telegram calls still in flight
+        
+        # Channel control writes are applied by a single background worker
+        self._write_queue: asyncio.Queue[Callable[[], Awaitable[None]]] = asyncio.Queue(maxsize=1024)
+        self._writer_task: Optional[asyncio.Task] = None
+        
+        # Bind the state routes to this instance once
+        self._msg_routes = {
+            state_name: getattr(self, handler_name)
+            for state_name, handler_name in self._MSG_ROUTES.items()
+        }
+        
+        # Short-lived copy of the accounts table for admin views
+        self._accounts_cache: Optional[List[Dict[str, Any]]] = None
+        self._accounts_cache_ts = 0.0
+        self._accounts_lock = asyncio.Lock()
+        
+        # Short-lived copy of the account health summary
+        self._health_cache: Optional[Dict[str, int]] = None
+        self._health_ts = 0.0
+        self._health_lock = asyncio.Lock()
     
     async def handle_callback(self, callback_query: types.CallbackQuery, state: FSMContext):
         """Handle admin callback queries"""
@@ -48,135 +296,123 @@ class AdminHandler:
         
         data = callback_query.data
         
-        # Admin account management
-        if data == "admin_accounts":
-            await self.show_account_management(callback_query)
-        elif data == "admin_logs":
-            await self.show_logs_menu(callback_query)
-        elif data == "admin_failed":
-            await self.show_failed_operations(callback_query)
-        elif data == "admin_banned":
-            await self.show_banned_accounts(callback_query)
-        elif data == "admin_health":
-            await self.show_account_health(callback_query)
-        # User stats and premium management removed for personal use
-        elif data == "admin_channel_control":
-            await self.show_channel_control(callback_query)
-        elif data == "add_account":
-            await self.start_add_account(callback_query, state)
-        elif data == "remove_account":
-            await self.start_remove_account(callback_query, state)
-        elif data == "list_accounts":
-            await self.list_accounts(callback_query)
-        elif data == "refresh_accounts":
-            await self.refresh_account_status(callback_query)
-        elif data == "api_default":
-            await self.use_default_api(callback_query, state)
-        elif data == "api_custom":
-            await self.use_custom_api(callback_query, state)
-        elif data == "cancel_operation":
-            await self.cancel_operation(callback_query, state)
-        # Premium management callbacks removed for personal use
-        elif data == "channel_whitelist":
-            await self.start_channel_whitelist(callback_query, state)
-        elif data == "channel_blacklist":
-            await self.start_channel_blacklist(callback_query, state)
-        elif data == "channel_lists":
-            await self.show_channel_lists(callback_query)
-        elif data == "channel_remove":
-            await self.start_channel_remove(callback_query, state)
-        elif data.startswith("logs_"):
-            await self.show_filtered_logs(callback_query, data)
-        elif data.startswith("account_details:"):
-            await self.show_account_details(callback_query, data)
-        else:
-            logger.warning(f"Unknown admin callback: {data}")
-            await callback_query.answer("Unknown command")
+        handler_name = self._STATIC_ROUTES.get(data)
+        if handler_name:
+            handler = getattr(self, handler_name)
+            if data in self._STATE_ROUTES:
+                await handler(callback_query, state)
+            else:
+                await handler(callback_query)
+            return
+        
+        for prefix, handler_name in self._PREFIX_ROUTES:
+            if data.startswith(prefix):
+                await getattr(self, handler_name)(callback_query, data)
+                return
+        
+        logger.warning(f"Unknown admin callback: {data}")
+        await callback_query.answer("Unknown command")
     
     async def handle_message(self, message: types.Message, state: FSMContext):
         """Handle admin text messages"""
-        current_state = await state.get_state()
-        
-        if current_state == AdminStates.waiting_for_phone.state:
-            await self.process_add_account(message, state)
-        elif current_state == AdminStates.waiting_for_remove_phone.state:
-            await self.process_remove_account(message, state)
-        elif current_state == AdminStates.waiting_for_custom_api_id.state:
-            await self.process_custom_api_id(message, state)
-        elif current_state == AdminStates.waiting_for_custom_api_hash.state:
-            await self.process_custom_api_hash(message, state)
-        elif current_state == AdminStates.waiting_for_verification_code.state:
-            await self.process_verification_code(message, state)
-        elif current_state == AdminStates.waiting_for_2fa_password.state:
-            await self.process_2fa_password(message, state)
-        # Premium management states removed for personal use
-        elif current_state == AdminStates.waiting_for_channel_link.state:
-            await self.process_channel_link(message, state)
-        elif current_state == AdminStates.waiting_for_channel_reason.state:
-            await self.process_channel_reason(message, state)
-        elif current_state == AdminStates.waiting_for_remove_channel.state:
-            await self.process_remove_channel(message, state)
+        route = self._msg_routes.get(await state.get_state())
+        if route:
+            await route(message, state)
     
     # Old admin panel function removed for personal use
     
+    def _enqueue_write(self, operation: Callable[[], Awaitable[None]]) -> bool:
+        """Queue a DB write for the background worker; False if the queue is full"""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._write_worker())
+        try:
+            self._write_queue.put_nowait(operation)
+            return True
+        except asyncio.QueueFull:
+            return False
+    
+    async def _write_worker(self):
+        """Apply queued DB writes one at a time"""
+        while True:
+            operation = await self._write_queue.get()
+            try:
+                await operation()
+            except Exception as e:
+                logger.error("Error applying queued admin write: %s", e)
+            finally:
+                self._write_queue.task_done()
+    
+    async def stop_writer(self):
+        """Flush pending writes and stop the background worker"""
+        if self._writer_task is None:
+            return
+        if not self._writer_task.done():
+            await self._write_queue.join()
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+        self._writer_task = None
+    
+    async def _get_accounts_cached(self, ttl: float = 5.0) -> List[Dict[str, Any]]:
+        """Get accounts, reusing a recent result for up to ttl seconds"""
+        if self._accounts_cache is not None and time.monotonic() - self._accounts_cache_ts < ttl:
+            return self._accounts_cache
+        async with self._accounts_lock:
+            # Another caller may have refreshed the cache while we waited
+            if self._accounts_cache is not None and time.monotonic() - self._accounts_cache_ts < ttl:
+                return self._accounts_cache
+            self._accounts_cache = await self.db.get_accounts()
+            self._accounts_cache_ts = time.monotonic()
+            return self._accounts_cache
+    
+    def _invalidate_accounts_cache(self):
+        """Force the next accounts read to hit the database"""
+        self._accounts_cache = None
+    
+    async def _health(self, force: bool = False, ttl: float = 10.0) -> Dict[str, int]:
+        """Get account health stats, reusing a recent result unless forced"""
+        if not force and self._health_cache is not None and time.monotonic() - self._health_ts < ttl:
+            return self._health_cache
+        async with self._health_lock:
+            if not force and self._health_cache is not None and time.monotonic() - self._health_ts < ttl:
+                return self._health_cache
+            self._health_cache = await self.telethon.check_account_health()
+            self._health_ts = time.monotonic()
+            return self._health_cache
+    
+    async def _reply(self, callback_query: types.CallbackQuery, text: str,
+                     reply_markup: Optional[types.InlineKeyboardMarkup] = None, parse_mode: str = "Markdown"):
+        """Edit the callback message and answer the callback concurrently"""
+        if not callback_query.message:
+            await callback_query.answer()
+            return
+        await asyncio.gather(
+            callback_query.message.edit_text(text, reply_markup=reply_markup, parse_mode=parse_mode),
+            callback_query.answer()
+        )
+    
     async def show_account_management(self, callback_query: types.CallbackQuery):
         """Show account management options"""
-        accounts = await self.db.get_accounts()
+        await callback_query.answer()
+        accounts = await self._get_accounts_cached()
         
-        text = f"""
-📱 **Account Management**
-
-Total Accounts: {len(accounts)}
-
-Quick Actions:
-• Add Account - Login with phone number
-• List Accounts - View all accounts with status
-• Remove Account - Delete account and session
-• Refresh Status - Update account health
-        """
+        text = _ACCOUNT_MGMT_TEXT.format(total=len(accounts))
         
         if callback_query.message:
-            await callback_query.message.edit_text(
+            self._fire(callback_query.message.edit_text(
                 text,
-                reply_markup=BotKeyboards.account_management(),
+                reply_markup=_KB_ACCOUNT_MGMT,
                 parse_mode="Markdown"
-            )
-        await callback_query.answer()
+            ))
     
     async def start_add_account(self, callback_query: types.CallbackQuery, state: FSMContext):
         """Start add account process"""
-        text = f"""
-➕ **Add New Account**
-
-Choose API credentials to use:
-
-🔹 **Default API** (Recommended)
-• Quick and easy setup
-• Uses system default credentials
-• API ID: {self.config.DEFAULT_API_ID}
-
-🔸 **Custom API** (Advanced)
-• Use your own API credentials
-• Get from https://my.telegram.org
-• More control and privacy
-
-Choose your preferred method:
-        """
-        
-        buttons = [
-            [types.InlineKeyboardButton(text="🔹 Use Default API", callback_data="api_default")],
-            [types.InlineKeyboardButton(text="🔸 Use Custom API", callback_data="api_custom")],
-            [types.InlineKeyboardButton(text="❌ Cancel", callback_data="cancel_operation")]
-        ]
+        text = _ADD_ACCOUNT_TEXT.format(api_id=self.config.DEFAULT_API_ID)
         
-        if callback_query.message:
-            await callback_query.message.edit_text(
-                text,
-                reply_markup=types.InlineKeyboardMarkup(inline_keyboard=buttons),
-                parse_mode="Markdown"
-            )
+        await self._reply(callback_query, text, _KB_API_CHOICE)
         await state.set_state(AdminStates.waiting_for_api_choice)
-        await callback_query.answer()
     
     async def process_add_account(self, message: types.Message, state: FSMContext):
         """Process add account with phone number - start verification"""
@@ -206,8 +442,6 @@ Choose your preferred method:
         try:
             success, result_message, verification_data = await self.telethon.start_account_verification(formatted_phone, api_id, api_hash)
             
-            await processing_msg.delete()
-            
             if success:
                 # Store verification data in state
                 await state.update_data(verification_data=verification_data)
@@ -231,21 +465,22 @@ Enter the verification code you received:
 Send the code or /cancel to abort.
                 """
                 
-                await message.answer(text, reply_markup=BotKeyboards.cancel_operation(), parse_mode="Markdown")
+                await self._finish_processing(processing_msg, message, text, reply_markup=_KB_CANCEL, parse_mode="Markdown")
                 await state.set_state(AdminStates.waiting_for_verification_code)
             else:
-                await message.answer(
+                await self._finish_processing(
+                    processing_msg, message,
                     f"{result_message}\n\n❌ Failed to start verification. Please try again.",
-                    reply_markup=BotKeyboards.account_management()
+                    reply_markup=_KB_ACCOUNT_MGMT
                 )
                 await state.clear()
         
         except Exception as e:
-            await processing_msg.delete()
             logger.error(f"Error starting verification: {e}")
-            await message.answer(
+            await self._finish_processing(
+                processing_msg, message,
                 "❌ An error occurred while starting verification. Please try again.",
-                reply_markup=BotKeyboards.account_management()
+                reply_markup=_KB_ACCOUNT_MGMT
             )
             await state.clear()
     
@@ -266,7 +501,7 @@ Send the code or /cancel to abort.
                     pass
             
             await state.clear()
-            await message.answer("❌ Operation cancelled", reply_markup=BotKeyboards.account_management())
+            await message.answer("❌ Operation cancelled", reply_markup=_KB_ACCOUNT_MGMT)
             return
         
         # Validate code format
@@ -279,7 +514,7 @@ Send the code or /cancel to abort.
         verification_data = data.get("verification_data")
         
         if not verification_data:
-            await message.answer("❌ Verification session expired. Please start again.", reply_markup=BotKeyboards.account_management())
+            await message.answer("❌ Verification session expired. Please start again.", reply_markup=_KB_ACCOUNT_MGMT)
             await state.clear()
             return
         
@@ -290,8 +525,6 @@ Send the code or /cancel to abort.
             # Handle both 2-value and 3-value returns from complete_account_verification
             result = await self.telethon.complete_account_verification(verification_data, code)
             
-            await processing_msg.delete()
-            
             if len(result) == 3:
                 # 2FA case: (success, message, updated_verification_data)
                 success, result_message, updated_verification_data = result
@@ -299,10 +532,11 @@ Send the code or /cancel to abort.
                     # 2FA required - transition to 2FA state
                     await state.update_data(verification_data=updated_verification_data)
                     await state.set_state(AdminStates.waiting_for_2fa_password)
-                    await message.answer(
+                    await self._finish_processing(
+                        processing_msg, message,
                         f"🔐 **Two-Factor Authentication Required**\n\n{result_message}\n\nEnter your 2FA password or /cancel to abort:",
                         parse_mode="Markdown",
-                        reply_markup=BotKeyboards.cancel_operation()
+                        reply_markup=_KB_CANCEL
                     )
                     return
             else:
@@ -310,23 +544,26 @@ Send the code or /cancel to abort.
                 success, result_message = result
             
             if success:
-                await message.answer(
+                self._invalidate_accounts_cache()
+                await self._finish_processing(
+                    processing_msg, message,
                     f"{result_message}\n\n🎉 Account successfully added and ready for use!",
-                    reply_markup=BotKeyboards.account_management()
+                    reply_markup=_KB_ACCOUNT_MGMT
                 )
             else:
-                await message.answer(
+                await self._finish_processing(
+                    processing_msg, message,
                     f"{result_message}\n\nPlease try again or /cancel to abort.",
-                    reply_markup=BotKeyboards.cancel_operation()
+                    reply_markup=_KB_CANCEL
                 )
                 return  # Don't clear state, allow retry
         
         except Exception as e:
-            await processing_msg.delete()
             logger.error(f"Error completing verification: {e}")
-            await message.answer(
+            await self._finish_processing(
+                processing_msg, message,
                 "❌ An error occurred during verification. Please try again or /cancel",
-                reply_markup=BotKeyboards.cancel_operation()
+                reply_markup=_KB_CANCEL
             )
             return  # Don't clear state, allow retry
         
@@ -349,7 +586,7 @@ Send the code or /cancel to abort.
                     pass
             
             await state.clear()
-            await message.answer("❌ Operation cancelled", reply_markup=BotKeyboards.account_management())
+            await message.answer("❌ Operation cancelled", reply_markup=_KB_ACCOUNT_MGMT)
             return
         
         # Get verification data from state
@@ -357,7 +594,7 @@ Send the code or /cancel to abort.
         verification_data = data.get("verification_data")
         
         if not verification_data:
-            await message.answer("❌ Verification session expired. Please start again.", reply_markup=BotKeyboards.account_management())
+            await message.answer("❌ Verification session expired. Please start again.", reply_markup=_KB_ACCOUNT_MGMT)
             await state.clear()
             return
         
@@ -367,26 +604,27 @@ Send the code or /cancel to abort.
         try:
             success, result_message = await self.telethon.complete_2fa_verification(verification_data, password)
             
-            await processing_msg.delete()
-            
             if success:
-                await message.answer(
+                self._invalidate_accounts_cache()
+                await self._finish_processing(
+                    processing_msg, message,
                     f"{result_message}\n\n🎉 Account successfully added with 2FA authentication!",
-                    reply_markup=BotKeyboards.account_management()
+                    reply_markup=_KB_ACCOUNT_MGMT
                 )
             else:
-                await message.answer(
+                await self._finish_processing(
+                    processing_msg, message,
                     f"{result_message}\n\nPlease try again or /cancel to abort.",
-                    reply_markup=BotKeyboards.cancel_operation()
+                    reply_markup=_KB_CANCEL
                 )
                 return  # Don't clear state, allow retry
         
         except Exception as e:
-            await processing_msg.delete()
             logger.error(f"Error completing 2FA verification: {e}")
-            await message.answer(
+            await self._finish_processing(
+                processing_msg, message,
                 "❌ An error occurred during 2FA verification. Please try again or /cancel",
-                reply_markup=BotKeyboards.cancel_operation()
+                reply_markup=_KB_CANCEL
             )
             return  # Don't clear state, allow retry
         
@@ -396,73 +634,18 @@ Send the code or /cancel to abort.
         """Use default API credentials"""
         await state.update_data(api_id=self.config.DEFAULT_API_ID, api_hash=self.config.DEFAULT_API_HASH)
         
-        text = f"""
-📱 **Add Account - Default API**
-
-Using default API credentials:
-• API ID: {self.config.DEFAULT_API_ID}
-• API Hash: {self.config.DEFAULT_API_HASH[:8]}...
-
-Please send the phone number for the new account.
-
-📋 **Format examples:**
-• +1234567890
-• +44 123 456 7890
-• 1234567890
-
-⚠️ **Requirements:**
-• Phone number has Telegram registered
-• Access to SMS/calls for verification
-• 2FA password ready (if enabled)
-
-Send the phone number or /cancel to abort.
-        """
+        text = _DEFAULT_API_TEXT.format(
+            api_id=self.config.DEFAULT_API_ID,
+            api_hash_prefix=self.config.DEFAULT_API_HASH[:8]
+        )
         
-        if callback_query.message:
-            await callback_query.message.edit_text(
-                text,
-                reply_markup=BotKeyboards.cancel_operation(),
-                parse_mode="Markdown"
-            )
+        await self._reply(callback_query, text, _KB_CANCEL)
         await state.set_state(AdminStates.waiting_for_phone)
-        await callback_query.answer()
     
     async def use_custom_api(self, callback_query: types.CallbackQuery, state: FSMContext):
         """Guide user to get custom API credentials"""
-        text = """
-🔸 **Custom API Setup**
-
-📋 **Step 1: Get Your API Credentials**
-
-1️⃣ Visit https://my.telegram.org
-2️⃣ Login with your phone number
-3️⃣ Go to "API Development Tools"
-4️⃣ Create a new app:
-   • App title: Any name (e.g., "My Bot")
-   • Short name: Any short name
-   • Platform: Other
-   • Description: Optional
-
-5️⃣ Copy your credentials:
-   • **api_id** (number)
-   • **api_hash** (32-character string)
-
-📱 **Step 2: Send Your API ID**
-
-Please send your **API ID** (numbers only):
-Example: 12345678
-
-Or /cancel to abort.
-        """
-        
-        if callback_query.message:
-            await callback_query.message.edit_text(
-                text,
-                reply_markup=BotKeyboards.cancel_operation(),
-                parse_mode="Markdown"
-            )
+        await self._reply(callback_query, _USE_CUSTOM_API_TEXT, _KB_CANCEL)
         await state.set_state(AdminStates.waiting_for_custom_api_id)
-        await callback_query.answer()
     
     async def process_custom_api_id(self, message: types.Message, state: FSMContext):
         """Process custom API ID input"""
@@ -472,7 +655,7 @@ Or /cancel to abort.
         
         if api_id_text == "/cancel":
             await state.clear()
-            await message.answer("❌ Operation cancelled", reply_markup=BotKeyboards.account_management())
+            await message.answer("❌ Operation cancelled", reply_markup=_KB_ACCOUNT_MGMT)
             return
         
         try:
@@ -495,7 +678,7 @@ Example: a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5p6
 Send your API Hash or /cancel to abort.
             """
             
-            await message.answer(text, reply_markup=BotKeyboards.cancel_operation(), parse_mode="Markdown")
+            await message.answer(text, reply_markup=_KB_CANCEL, parse_mode="Markdown")
             await state.set_state(AdminStates.waiting_for_custom_api_hash)
             
         except ValueError:
@@ -509,11 +692,11 @@ Send your API Hash or /cancel to abort.
         
         if api_hash == "/cancel":
             await state.clear()
-            await message.answer("❌ Operation cancelled", reply_markup=BotKeyboards.account_management())
+            await message.answer("❌ Operation cancelled", reply_markup=_KB_ACCOUNT_MGMT)
             return
         
-        if len(api_hash) != 32:
-            await message.answer("❌ Invalid API Hash. Must be exactly 32 characters. Please try again or /cancel")
+        if not _API_HASH_RE.match(api_hash):
+            await message.answer("❌ Invalid API Hash. Must be exactly 32 hexadecimal characters. Please try again or /cancel")
             return
         
         data = await state.get_data()
@@ -543,22 +726,17 @@ Please send the phone number for the new account.
 Send the phone number or /cancel to abort.
         """
         
-        await message.answer(text, reply_markup=BotKeyboards.cancel_operation(), parse_mode="Markdown")
+        await message.answer(text, reply_markup=_KB_CANCEL, parse_mode="Markdown")
         await state.set_state(AdminStates.waiting_for_phone)
     
     async def cancel_operation(self, callback_query: types.CallbackQuery, state: FSMContext):
         """Cancel current operation"""
         await state.clear()
-        await callback_query.message.edit_text(
-            "❌ **Operation Cancelled**\n\nReturning to account management.",
-            reply_markup=BotKeyboards.account_management(),
-            parse_mode="Markdown"
-        )
-        await callback_query.answer()
+        await self._reply(callback_query, "❌ **Operation Cancelled**\n\nReturning to account management.", _KB_ACCOUNT_MGMT)
     
     async def start_remove_account(self, callback_query: types.CallbackQuery, state: FSMContext):
         """Start remove account process"""
-        accounts = await self.db.get_accounts()
+        accounts = await self._get_accounts_cached()
         
         if not accounts:
             await callback_query.answer("❌ No accounts to remove", show_alert=True)
@@ -585,14 +763,8 @@ Please send the phone number of the account to remove:
 Send the phone number or /cancel to abort.
         """
         
-        if callback_query.message:
-            await callback_query.message.edit_text(
-                text,
-                reply_markup=BotKeyboards.cancel_operation(),
-                parse_mode="Markdown"
-            )
+        await self._reply(callback_query, text, _KB_CANCEL)
         await state.set_state(AdminStates.waiting_for_remove_phone)
-        await callback_query.answer()
     
     async def process_remove_account(self, message: types.Message, state: FSMContext):
         """Process remove account"""
@@ -608,107 +780,93 @@ Send the phone number or /cancel to abort.
         formatted_phone = Utils.format_phone(phone)
         
         success, result_message = await self.telethon.remove_account(formatted_phone)
+        if success:
+            self._invalidate_accounts_cache()
         
         await message.answer(
             result_message,
-            reply_markup=BotKeyboards.account_management()
+            reply_markup=_KB_ACCOUNT_MGMT
         )
         await state.clear()
     
     async def list_accounts(self, callback_query: types.CallbackQuery):
         """List all accounts with status"""
-        accounts = await self.db.get_accounts()
+        await callback_query.answer()
+        accounts = await self._get_accounts_cached()
         
         if not accounts:
             text = "📱 **Account List**\n\n❌ No accounts configured yet.\n\nUse 'Add Account' to get started."
         else:
-            text = f"📱 **Account List** ({len(accounts)} total)\n\n"
+            parts = [f"📱 **Account List** ({len(accounts)} total)\n\n"]
             
             for account in accounts:
                 status_info = Utils.format_account_status(account)
                 last_used = Utils.format_datetime(account.get("last_used"))
                 failed_attempts = account.get("failed_attempts", 0)
                 
-                text += f"{status_info}\n"
-                text += f"   └ Last used: {last_used}"
+                parts.append(f"{status_info}\n   └ Last used: {last_used}")
                 if failed_attempts > 0:
-                    text += f" | Failed: {failed_attempts}"
-                text += "\n\n"
+                    parts.append(f" | Failed: {failed_attempts}")
+                parts.append("\n\n")
+            
+            text = "".join(parts)
         
-        await callback_query.message.edit_text(
+        # The keyboard only needs a few columns of the first page
+        rows = [
+            (account["id"], account["status"], account.get("username"), account.get("phone", "Unknown"))
+            for account in accounts[:10]
+        ]
+        
+        self._fire(callback_query.message.edit_text(
             text,
-            reply_markup=BotKeyboards.account_list_admin(accounts),
+            reply_markup=BotKeyboards.account_list_admin_rows(rows),
             parse_mode="Markdown"
-        )
-        await callback_query.answer()
+        ))
     
     async def refresh_account_status(self, callback_query: types.CallbackQuery):
         """Refresh account health status"""
         await callback_query.answer("🔄 Refreshing account status...")
         
-        health_stats = await self.telethon.check_account_health()
+        health_stats = await self._health(force=True)
+        self._invalidate_accounts_cache()
         
-        text = f"""
-🔄 **Account Status Refreshed**
-
-📊 **Current Status:**
-✅ Active: {health_stats.get('active', 0)}
-🚫 Banned: {health_stats.get('banned', 0)}
-⏳ Flood Wait: {health_stats.get('flood_wait', 0)}
-❌ Inactive: {health_stats.get('inactive', 0)}
-
-Last updated: {datetime.now().strftime('%H:%M:%S')}
-        """
+        text = _REFRESH_STATUS_TEXT.format(
+            active=health_stats.get('active', 0),
+            banned=health_stats.get('banned', 0),
+            flood_wait=health_stats.get('flood_wait', 0),
+            inactive=health_stats.get('inactive', 0),
+            updated=datetime.now().strftime('%H:%M:%S')
+        )
         
-        await callback_query.message.edit_text(
+        self._fire(callback_query.message.edit_text(
             text,
-            reply_markup=BotKeyboards.account_management(),
+            reply_markup=_KB_ACCOUNT_MGMT,
             parse_mode="Markdown"
-        )
+        ))
     
     async def show_logs_menu(self, callback_query: types.CallbackQuery):
         """Show logs filtering menu"""
-        text = """
-📊 **System Logs**
-
-Choose log type to view:
-• All Logs - Complete activity log
-• Joins - Channel join activities
-• Boosts - View boosting operations
-• Errors - System errors and failures
-• Bans - Account ban notifications
-• Flood Waits - Rate limiting events
-        """
-        
+        await callback_query.answer()
         if callback_query.message:
-            await callback_query.message.edit_text(
-                text,
-                reply_markup=BotKeyboards.log_types(),
+            self._fire(callback_query.message.edit_text(
+                _LOGS_MENU_TEXT,
+                reply_markup=_KB_LOG_TYPES,
                 parse_mode="Markdown"
-            )
-        await callback_query.answer()
+            ))
     
     async def show_filtered_logs(self, callback_query: types.CallbackQuery, data: str):
         """Show filtered logs"""
-        log_type_map = {
-            "logs_all": None,
-            "logs_join": LogType.JOIN,
-            "logs_boost": LogType.BOOST,
-            "logs_error": LogType.ERROR,
-            "logs_ban": LogType.BAN,
-            "logs_flood_wait": LogType.FLOOD_WAIT
-        }
-        
-        log_type = log_type_map.get(data)
+        await callback_query.answer()
+        log_type = _LOG_TYPE_MAP.get(data)
         logs = await self.db.get_logs(limit=20, log_type=log_type)
         
         # Format title properly
-        log_title = data.replace('logs_', '').replace('_', ' ').title()
+        log_title = _LOG_LABELS.get(data) or data.replace('logs_', '').replace('_', ' ').title()
         
         if not logs:
             text = f"📊 **{log_title} Logs**\n\n❌ No logs found."
         else:
-            text = f"📊 **{log_title} Logs** (Last 20)\n\n"
+            parts = [f"📊 **{log_title} Logs** (Last 20)\n\n"]
             
             for log in logs:
                 timestamp = Utils.format_datetime(log["created_at"])
@@ -722,25 +880,26 @@ Choose log type to view:
                 else:
                     account = ""
                 
-                text += f"🕐 {timestamp}\n"
-                text += f"📝 {message}{account}\n\n"
+                parts.append(f"🕐 {timestamp}\n📝 {message}{account}\n\n")
+            
+            text = "".join(parts)
         
         if callback_query.message:
-            await callback_query.message.edit_text(
+            self._fire(callback_query.message.edit_text(
                 text,
-                reply_markup=BotKeyboards.back_button("admin_logs"),
+                reply_markup=_KB_BACK_ADMIN_LOGS,
                 parse_mode="Markdown"
-            )
-        await callback_query.answer()
+            ))
     
     async def show_failed_operations(self, callback_query: types.CallbackQuery):
         """Show failed operations"""
+        await callback_query.answer()
         error_logs = await self.db.get_logs(limit=10, log_type=LogType.ERROR)
         
         if not error_logs:
             text = "❌ **Failed Operations**\n\n✅ No recent failures!"
         else:
-            text = f"❌ **Failed Operations** (Last 10)\n\n"
+            parts = ["❌ **Failed Operations** (Last 10)\n\n"]
             
             for log in error_logs:
                 timestamp = Utils.format_datetime(log["created_at"])
@@ -753,53 +912,62 @@ Choose log type to view:
                 else:
                     account = "Unknown account"
                 
-                text += f"🕐 {timestamp}\n"
-                text += f"📱 {account}\n"
-                text += f"❌ {message}\n\n"
+                parts.append(f"🕐 {timestamp}\n📱 {account}\n❌ {message}\n\n")
+            
+            text = "".join(parts)
         
         if callback_query.message:
-            await callback_query.message.edit_text(
+            self._fire(callback_query.message.edit_text(
                 text,
-                reply_markup=BotKeyboards.back_button("main_menu"),
+                reply_markup=_KB_BACK_MAIN_MENU,
                 parse_mode="Markdown"
-            )
-        await callback_query.answer()
+            ))
     
     async def show_banned_accounts(self, callback_query: types.CallbackQuery):
         """Show banned accounts"""
-        accounts = await self.db.get_accounts()
-        banned_accounts = [acc for acc in accounts if acc["status"] == "banned"]
+        await callback_query.answer()
+        banned_accounts = await self.db.get_accounts_by_status(AccountStatus.BANNED.value)
         
         if not banned_accounts:
             text = "🚫 **Banned Accounts**\n\n✅ No banned accounts!"
         else:
-            text = f"🚫 **Banned Accounts** ({len(banned_accounts)} total)\n\n"
+            parts = [f"🚫 **Banned Accounts** ({len(banned_accounts)} total)\n\n"]
             
             for account in banned_accounts:
                 username = account.get("username")
                 display_name = f"@{username}" if username and not username.startswith('@') else username or account.get("phone", "Unknown")
                 banned_since = Utils.format_datetime(account.get("last_used"))
                 
-                text += f"📱 {display_name}\n"
-                text += f"   └ Banned: {banned_since}\n\n"
+                parts.append(f"📱 {display_name}\n   └ Banned: {banned_since}\n\n")
+            
+            text = "".join(parts)
         
-        await callback_query.message.edit_text(
+        self._fire(callback_query.message.edit_text(
             text,
-            reply_markup=BotKeyboards.back_button("main_menu"),
+            reply_markup=_KB_BACK_MAIN_MENU,
             parse_mode="Markdown"
-        )
-        await callback_query.answer()
+        ))
     
     async def show_account_health(self, callback_query: types.CallbackQuery):
         """Show detailed account health"""
-        health_stats = await self.telethon.check_account_health()
-        accounts = await self.db.get_accounts()
+        await callback_query.answer()
+        health_stats, accounts = await asyncio.gather(
+            self._health(),
+            self._get_accounts_cached()
+        )
         
-        # Calculate additional stats
         total_accounts = len(accounts)
-        health_percentage = (health_stats.get('active', 0) / total_accounts * 100) if total_accounts > 0 else 0
-        
-        text = f"""
+        if total_accounts == 0:
+            text = _NO_ACCOUNTS_HEALTH_TEXT
+        else:
+            active = health_stats.get('active', 0)
+            banned = health_stats.get('banned', 0)
+            flood_wait = health_stats.get('flood_wait', 0)
+            inactive = health_stats.get('inactive', 0)
+            scale = 100.0 / total_accounts
+            health_percentage = active * scale
+            
+            text = f"""
 ⚡ **Account Health Report**
 
 📊 **Overview:**
@@ -807,29 +975,28 @@ Total Accounts: {total_accounts}
 Health Score: {health_percentage:.1f}%
 
 📈 **Status Breakdown:**
-✅ Active: {health_stats.get('active', 0)} ({health_stats.get('active', 0)/total_accounts*100:.1f}%)
-🚫 Banned: {health_stats.get('banned', 0)} ({health_stats.get('banned', 0)/total_accounts*100:.1f}%)
-⏳ Flood Wait: {health_stats.get('flood_wait', 0)} ({health_stats.get('flood_wait', 0)/total_accounts*100:.1f}%)
-❌ Inactive: {health_stats.get('inactive', 0)} ({health_stats.get('inactive', 0)/total_accounts*100:.1f}%)
+✅ Active: {active} ({active * scale:.1f}%)
+🚫 Banned: {banned} ({banned * scale:.1f}%)
+⏳ Flood Wait: {flood_wait} ({flood_wait * scale:.1f}%)
+❌ Inactive: {inactive} ({inactive * scale:.1f}%)
 
 🔧 **Recommendations:**
         """
-        
-        if health_stats.get('banned', 0) > 0:
-            text += "• Remove banned accounts\n"
-        if health_stats.get('inactive', 0) > 0:
-            text += "• Check inactive account sessions\n"
-        if health_stats.get('active', 0) < 3:
-            text += "• Add more active accounts for better rotation\n"
-        if health_percentage == 100:
-            text += "• All accounts are healthy! 🎉\n"
-        
-        await callback_query.message.edit_text(
+            
+            if banned > 0:
+                text += "• Remove banned accounts\n"
+            if inactive > 0:
+                text += "• Check inactive account sessions\n"
+            if active < 3:
+                text += "• Add more active accounts for better rotation\n"
+            if active == total_accounts:
+                text += "• All accounts are healthy! 🎉\n"
+        
+        self._fire(callback_query.message.edit_text(
             text,
-            reply_markup=BotKeyboards.back_button("main_menu"),
+            reply_markup=_KB_BACK_MAIN_MENU,
             parse_mode="Markdown"
-        )
-        await callback_query.answer()
+        ))
     
     # User stats removed for personal use
     
@@ -837,8 +1004,7 @@ Health Score: {health_percentage:.1f}%
         """Show detailed account information"""
         try:
             account_id = int(data.split(":")[1])
-            accounts = await self.db.get_accounts()
-            account = next((acc for acc in accounts if acc["id"] == account_id), None)
+            account = await self.db.get_account_by_id(account_id)
             
             if not account:
                 await callback_query.answer("❌ Account not found", show_alert=True)
@@ -865,12 +1031,7 @@ Failed Attempts: {failed_attempts}
 Use the account management menu to add/remove accounts.
             """
             
-            await callback_query.message.edit_text(
-                text,
-                reply_markup=BotKeyboards.back_button("list_accounts"),
-                parse_mode="Markdown"
-            )
-            await callback_query.answer()
+            await self._reply(callback_query, text, _KB_BACK_LIST_ACCOUNTS)
             
         except Exception as e:
             logger.error(f"Error showing account details: {e}")
@@ -880,34 +1041,30 @@ Use the account management menu to add/remove accounts.
     
     async def show_channel_control(self, callback_query: types.CallbackQuery):
         """Show channel control panel"""
+        await callback_query.answer()
         channel_lists = await self.db.get_channel_control_lists()
         whitelist_count = len(channel_lists["whitelisted"])
         blacklist_count = len(channel_lists["blacklisted"])
         
-        text = f"""
-🎯 **Channel Control Center**
-
-┌──── 📊 **Security Status** ────┐
-│ Whitelisted: {whitelist_count} channels
-│ Blacklisted: {blacklist_count} channels
-│ Protection Level: Active
-└────────────────────────────────┘
-
-🛡️ **Control Options:**
-• ✅ **Whitelist Channel** - Allow priority access
-• ❌ **Blacklist Channel** - Block completely
-• 📋 **View Lists** - Review all entries
-• 🗑️ **Remove Entry** - Clean up lists
-
-🚨 **Security Actions Available Below**
-        """
+        text = _CHANNEL_CONTROL_TEXT.format(whitelist_count=whitelist_count, blacklist_count=blacklist_count)
         
-        await callback_query.message.edit_text(
+        # Skip the edit if this message still shows the same menu
+        message = callback_query.message
+        digest = hashlib.blake2b(text.encode(), digest_size=8).digest()
+        key = (message.chat.id, message.message_id)
+        if self._last_render.get(key) == (digest, message.text):
+            self._last_render.move_to_end(key)
+            return
+        
+        edited = await message.edit_text(
             text,
-            reply_markup=BotKeyboards.channel_control(),
-            parse_mode="Markdown"
+            reply_markup=_KB_CHANNEL_CONTROL,
+            parse_mode="HTML"
         )
-        await callback_query.answer()
+        self._last_render[key] = (digest, getattr(edited, "text", None))
+        self._last_render.move_to_end(key)
+        if len(self._last_render) > 10_000:
+            self._last_render.popitem(last=False)
     
     # Premium management action functions removed for personal use
     
@@ -915,125 +1072,133 @@ Use the account management menu to add/remove accounts.
     
     async def start_channel_whitelist(self, callback_query: types.CallbackQuery, state: FSMContext):
         """Start channel whitelist process"""
+        await callback_query.answer()
         text = """
-✅ **Whitelist Channel**
+✅ <b>Whitelist Channel</b>
 
-┌──── 📝 **Instructions** ────┐
+┌──── 📝 <b>Instructions</b> ────┐
 │ Send the channel link or     │
 │ username to whitelist        │
 └─────────────────────────────┘
 
-📱 **Supported formats:**
+📱 <b>Supported formats:</b>
 • https://t.me/channel_name
 • @channel_name
 • channel_name
 
-💡 **Note:** Whitelisted channels get priority access
+💡 <b>Note:</b> Whitelisted channels get priority access
         """
         
         await callback_query.message.edit_text(
             text,
-            reply_markup=BotKeyboards.cancel_operation(),
-            parse_mode="Markdown"
+            reply_markup=_KB_CANCEL,
+            parse_mode="HTML"
         )
-        await state.set_state(AdminStates.waiting_for_channel_link)
-        await state.update_data(action="whitelist")
-        await callback_query.answer()
+        await self._enter_state(state, AdminStates.waiting_for_channel_link, action="whitelist")
     
     async def start_channel_blacklist(self, callback_query: types.CallbackQuery, state: FSMContext):
         """Start channel blacklist process"""
+        await callback_query.answer()
         text = """
-❌ **Blacklist Channel**
+❌ <b>Blacklist Channel</b>
 
-┌──── 📝 **Instructions** ────┐
+┌──── 📝 <b>Instructions</b> ────┐
 │ Send the channel link or     │
 │ username to blacklist        │
 └─────────────────────────────┘
 
-📱 **Supported formats:**
+📱 <b>Supported formats:</b>
 • https://t.me/channel_name
 • @channel_name
 • channel_name
 
-⚠️ **Warning:** Blacklisted channels will be completely blocked
+⚠️ <b>Warning:</b> Blacklisted channels will be completely blocked
         """
         
         await callback_query.message.edit_text(
             text,
-            reply_markup=BotKeyboards.cancel_operation(),
-            parse_mode="Markdown"
+            reply_markup=_KB_CANCEL,
+            parse_mode="HTML"
         )
-        await state.set_state(AdminStates.waiting_for_channel_link)
-        await state.update_data(action="blacklist")
-        await callback_query.answer()
+        await self._enter_state(state, AdminStates.waiting_for_channel_link, action="blacklist")
     
     async def show_channel_lists(self, callback_query: types.CallbackQuery):
         """Show whitelist and blacklist"""
+        await callback_query.answer()
         channel_lists = await self.db.get_channel_control_lists()
         whitelist = channel_lists["whitelisted"]
         blacklist = channel_lists["blacklisted"]
         
-        text = f"""
-📋 **Channel Control Lists**
+        if not whitelist and not blacklist:
+            await callback_query.message.edit_text(
+                _EMPTY_CHANNEL_LISTS_TEXT,
+                reply_markup=_KB_BACK_CHANNEL_CONTROL,
+                parse_mode="HTML"
+            )
+            return
+        
+        parts = [f"""
+📋 <b>Channel Control Lists</b>
 
-✅ **Whitelisted Channels** ({len(whitelist)}):
-"""
+✅ <b>Whitelisted Channels</b> ({len(whitelist)}):
+"""]
         if whitelist:
-            for channel in whitelist[:5]:  # Show first 5
-                link = Utils.truncate_text(channel['channel_link'], 40)
-                date = Utils.format_datetime(channel['created_at'])
-                text += f"• {link} ({date})\n"
+            parts.extend(
+                f"• {html.escape(truncate(row.channel_link), quote=False)} ({Utils.format_datetime(row.created_at)})\n"
+                for row in whitelist[:5]  # Show first 5
+            )
             if len(whitelist) > 5:
-                text += f"... and {len(whitelist) - 5} more\n"
+                parts.append(f"... and {len(whitelist) - 5} more\n")
         else:
-            text += "• No whitelisted channels\n"
+            parts.append("• No whitelisted channels\n")
         
-        text += f"""
-❌ **Blacklisted Channels** ({len(blacklist)}):
-"""
+        parts.append(f"""
+❌ <b>Blacklisted Channels</b> ({len(blacklist)}):
+""")
         if blacklist:
-            for channel in blacklist[:5]:  # Show first 5
-                link = Utils.truncate_text(channel['channel_link'], 40)
-                date = Utils.format_datetime(channel['created_at'])
-                reason = channel.get('reason', 'No reason')
-                text += f"• {link}\n  Reason: {reason} ({date})\n"
+            parts.extend(
+                f"• {html.escape(truncate(row.channel_link), quote=False)}\n"
+                f"  Reason: {html.escape(row.reason or 'No reason', quote=False)} ({Utils.format_datetime(row.created_at)})\n"
+                for row in blacklist[:5]  # Show first 5
+            )
             if len(blacklist) > 5:
-                text += f"... and {len(blacklist) - 5} more\n"
+                parts.append(f"... and {len(blacklist) - 5} more\n")
         else:
-            text += "• No blacklisted channels\n"
+            parts.append("• No blacklisted channels\n")
+        
+        text = "".join(parts)
         
         await callback_query.message.edit_text(
             text,
-            reply_markup=BotKeyboards.back_button("admin_channel_control"),
-            parse_mode="Markdown"
+            reply_markup=_KB_BACK_CHANNEL_CONTROL,
+            parse_mode="HTML"
         )
-        await callback_query.answer()
     
     async def start_channel_remove(self, callback_query: types.CallbackQuery, state: FSMContext):
         """Start channel removal process"""
+        await callback_query.answer()
         text = """
-🗑️ **Remove Channel from Lists**
+🗑️ <b>Remove Channel from Lists</b>
 
-┌──── 📝 **Instructions** ────┐
+┌──── 📝 <b>Instructions</b> ────┐
 │ Send the channel link to     │
 │ remove from control lists    │
 └─────────────────────────────┘
 
-📱 **Supported formats:**
+📱 <b>Supported formats:</b>
 • https://t.me/channel_name
 • @channel_name
 • channel_name
 
-💡 **Note:** This removes from both whitelist and blacklist
+💡 <b>Note:</b> This removes from both whitelist and blacklist
         """
         
         await callback_query.message.edit_text(
             text,
-            reply_markup=BotKeyboards.cancel_operation(),
-            parse_mode="Markdown"
+            reply_markup=_KB_CANCEL,
+            parse_mode="HTML"
         )
         await state.set_state(AdminStates.waiting_for_remove_channel)
-        await callback_query.answer()
     
     # === Processing Functions ===
     
@@ -1049,20 +1214,23 @@ Use the account management menu to add/remove accounts.
             
             # Ask for reason if blacklisting
             if action == "blacklist":
-                await state.update_data(channel_link=channel_link)
-                await state.set_state(AdminStates.waiting_for_channel_reason)
+                await self._enter_state(state, AdminStates.waiting_for_channel_reason, channel_link=channel_link)
                 await message.answer("📝 Please provide a reason for blacklisting this channel:")
                 return
             
             # For whitelist, add directly
             if action == "whitelist":
-                await self.db.add_channel_to_whitelist(channel_link, admin_id, "Whitelisted by admin")
+                if not self._enqueue_write(
+                    lambda: self.db.add_channel_to_whitelist(channel_link, admin_id, "Whitelisted by admin")
+                ):
+                    await message.answer("⏳ Busy right now, please try again in a moment.")
+                    return
                 await message.answer(f"✅ Channel whitelisted successfully:\n{Utils.truncate_text(channel_link, 50)}")
             
             await state.clear()
             
         except Exception as e:
-            logger.error(f"Error processing channel link: {e}")
+            logger.error("Error processing channel link: %s", e)
             await message.answer("❌ Error processing request. Please try again.")
     
     async def process_channel_reason(self, message: types.Message, state: FSMContext):
@@ -1073,13 +1241,17 @@ Use the account management menu to add/remove accounts.
             channel_link = data.get("channel_link")
             admin_id = message.from_user.id
             
-            await self.db.add_channel_to_blacklist(channel_link, admin_id, reason)
+            if not self._enqueue_write(
+                lambda: self.db.add_channel_to_blacklist(channel_link, admin_id, reason)
+            ):
+                await message.answer("⏳ Busy right now, please try again in a moment.")
+                return
             await message.answer(f"✅ Channel blacklisted successfully:\n{Utils.truncate_text(channel_link, 50)}\nReason: {reason}")
             
             await state.clear()
             
         except Exception as e:
-            logger.error(f"Error processing channel reason: {e}")
+            logger.error("Error processing channel reason: %s", e)
             await message.answer("❌ Error processing request. Please try again.")
     
     async def process_remove_channel(self, message: types.Message, state: FSMContext):
@@ -1087,11 +1259,13 @@ Use the account management menu to add/remove accounts.
         try:
             channel_link = message.text.strip()
             
-            await self.db.remove_from_channel_control(channel_link)
+            if not self._enqueue_write(lambda: self.db.remove_from_channel_control(channel_link)):
+                await message.answer("⏳ Busy right now, please try again in a moment.")
+                return
             await message.answer(f"✅ Channel removed from control lists:\n{Utils.truncate_text(channel_link, 50)}")
             
             await state.clear()
             
         except Exception as e:
-            logger.error(f"Error removing channel: {e}")
+            logger.error("Error removing channel: %s", e)
             await message.answer("❌ Error processing request. Please try again.")
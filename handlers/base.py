@@ -0,0 +1,44 @@
+"""
+Shared helpers for the admin and user handlers
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable
+
+from aiogram import types
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
+
+logger = logging.getLogger(__name__)
+
+
+class HandlerBase:
+    """Background-call, FSM and processing-message helpers; subclasses set self._bg_tasks"""
+
+    _bg_tasks: set
+
+    def _fire(self, coro: Awaitable[Any]):
+        """Run a Telegram call in the background without holding up the handler"""
+        task = asyncio.ensure_future(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._on_fire_done)
+
+    def _on_fire_done(self, task: asyncio.Future):
+        """Drop a finished background call and log its failure"""
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error("Background Telegram call failed: %s", task.exception())
+
+    async def _enter_state(self, state: FSMContext, new_state: State, **data):
+        """Switch FSM state and replace its data without a read-modify-write"""
+        await state.set_state(new_state)
+        await state.set_data(data)
+
+    async def _finish_processing(self, processing_msg: types.Message, message: types.Message, text: str, **kwargs):
+        """Turn the processing message into the final result, replying only if it can't be edited"""
+        try:
+            await processing_msg.edit_text(text, **kwargs)
+        except TelegramBadRequest as e:
+            logger.warning("Could not edit processing message, sending a new one: %s", e)
+            await message.answer(text, **kwargs)
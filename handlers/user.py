@@ -3,11 +3,17 @@ User handlers for the Telegram View Booster Bot
 Handles channel management, boosting, and settings
 """
 import asyncio
+import html
 import json
 import logging
-from typing import Optional, Any
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 from aiogram import Bot, types
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
@@ -16,10 +22,368 @@ from config import Config
 from database import DatabaseManager, LogType
 from session_manager import TelethonManager
 from inline_keyboards import BotKeyboards
-from helpers import Utils
+from helpers import DELAY_RANGES, Utils
+from handlers.base import HandlerBase
 
 logger = logging.getLogger(__name__)
 
+# Message URLs on t.me / telegram.me, public (name/id) or private (c/chat/id), optionally followed by a query or fragment
+_TG_URL_RE = re.compile(r'https://(?:t|telegram)\.me/(?:c/\d+|\w+)/\d+(?:[/?#]\S*)?')
+_TG_URL_MAX_LEN = 256
+_TG_PREFIXES = ("https://t.me/", "https://telegram.me/")
+
+# Static message chrome, built once at import
+_MAIN_MENU_PREFIX = """
+🎯 **Professional View Booster**
+
+┌─────────────────────────┐
+│  Welcome, {name}! 👋
+└─────────────────────────┘
+
+🔥 **Boost your Telegram channels with premium quality views**
+💎 **Powered by advanced automation technology**
+
+"""
+# Full admin / user variants, so a render is a single format call
+_MAIN_MENU_ADMIN = _MAIN_MENU_PREFIX + "🛠 **Administrator Access** - Choose your management panel:\n        "
+_MAIN_MENU_USER = _MAIN_MENU_PREFIX + "⚡ **Ready to boost your content?** - Select an option below:\n        "
+
+_DASHBOARD_TEXT = """
+🎭 **Personal Dashboard**
+
+**Account Overview:**
+• Status: 🌟 Personal Admin Access
+• Channels: {channel_count} (Unlimited)  
+• Total Boosts: {total_boosts:,} views
+
+💪 **Ready to amplify your reach?**
+🚀 **Choose your next action below:**
+        """
+
+_STATS_TEXT = """
+📊 **My Statistics**
+
+👤 **Account Info:**
+Status: Personal Admin Access ⭐
+Member Since: {member_since}
+
+📢 **Channel Stats:**
+Total Channels: {channel_count} (Unlimited)
+Total Boosts: {total_boosts:,}
+
+📈 **Recent Activity:**
+        """
+
+_BOOST_ACCOUNTS_TEXT = """
+📊 **Account Status**
+
+Channel: {channel_name}
+
+💯 **Available Accounts:** {available_count:,}
+
+📝 **How it works:**
+• Each account will view your selected messages
+• Views are distributed across the timeframe you choose
+• You can select how many views you want
+• Choose between auto-detection or manual message selection
+
+🚀 **Ready to continue?**
+Click Continue to select the number of views you want.
+            """
+
+_REACTION_ACCOUNTS_TEXT = """
+📊 **Account Status**
+
+Channel: {channel_name}
+
+💯 **Available Accounts:** {available_count:,}
+
+😍 **How it works:**
+• Each account reacts with a random emoji
+• Accounts cycle through messages based on your selection
+• Popular emojis: ❤️ 👍 😂 🔥 💯 🎉 😍 and more!
+• You can choose how many reactions and timing
+
+🚀 **Ready to continue?**
+Click Continue to select the number of reactions you want.
+            """
+
+_VIEW_COUNT_TEXT = """
+📊 **Select View Count**
+
+Channel: {channel_link}
+💯 Available Accounts: {available_accounts:,}
+
+🎯 **Choose how many views you want:**
+Select from the options below based on your available accounts.
+            """
+
+_CUSTOM_VIEW_COUNT_TEXT = """
+✏️ **Custom View Count**
+
+💯 Available Accounts: {available_accounts:,}
+
+Enter the number of views you want (up to {available_accounts:,}):
+                """
+
+_TIME_FRAME_TEXT = """
+⏰ **Select Time Frame**
+
+📊 Views Selected: {view_count:,}
+📢 Channel: {channel_link}
+
+🕒 **Choose time frame for the views:**
+Select how quickly you want the views to be delivered.
+            """
+
+_CHOOSE_MODE_TEXT = """
+🎯 **Choose Mode**
+
+📊 Views: {view_count:,}
+⏰ Time Frame: {time_text}
+📢 Channel: {channel_link}
+
+🤖 **Auto Mode:** Automatically boost the latest messages
+✋ **Manual Mode:** Choose specific message IDs
+
+Select your preferred mode:
+            """
+
+_MANUAL_IDS_TEXT = """
+✏️ **Manual Message Selection**
+
+📊 {action_type}: {view_count:,}
+⏰ Time Frame: {time_text}
+
+Send message IDs or message links separated by commas or spaces.
+
+**Examples:**
+• 123, 124, 125
+• 100 101 102
+• 50-55 (range)
+• https://t.me/channel/123
+
+Send your message IDs now:
+                """
+
+_SETTINGS_TEXT = """
+⚙️ **Advanced Configuration**
+
+┌──── ⏱️ **Performance Settings** ────┐
+│ 
+│ 🎯 **Boost Timing:**
+│ → Current: {delay_level} Speed
+│ → Interval: {delay_min}-{delay_max} seconds
+│ 
+│ 🤖 **Smart Automation:**
+│ → Account Rotation: ✅ Active
+│ → Message Reading: ✅ Enabled
+│ → Performance Mode: 🚀 Optimized
+│
+└────────────────────────────────────┘
+
+💡 **Tip:** Our AI manages accounts automatically for maximum efficiency
+            """
+
+_DELAY_CONFIG_TEXT = """
+⚡ **Performance Optimization Center**
+
+┌──── 🎯 **Speed Configuration** ────┐
+│
+│ Choose your preferred performance level:
+│
+└───────────────────────────────────┘
+
+🚀 **Fast Mode (1-2s)**
+   → Maximum speed delivery
+   → Higher engagement rate
+   → Ideal for trending content
+
+⚡ **Balanced Mode (2-5s)** ⭐ **Recommended**
+   → Optimal speed vs safety ratio
+   → Best overall performance
+   → Professional standard
+
+🛡️ **Safe Mode (5-10s)**
+   → Maximum account protection
+   → Conservative approach
+   → Long-term stability focus
+
+💡 **Pro Tip:** Balanced mode offers the best results for most campaigns
+            """
+
+_DELAY_LEVELS = {"delay_low": "low", "delay_medium": "medium", "delay_high": "high"}
+_DELAY_RESPONSES = {
+    "low": "🚀 Fast Mode activated - Maximum speed enabled!",
+    "medium": "⚡ Balanced Mode activated - Optimal performance!",
+    "high": "🛡️ Safe Mode activated - Maximum protection!",
+}
+
+_AUTO_COUNT_TEXT = """
+📊 **Auto Message Count Configuration**
+
+┌──── 🎯 **Auto Mode Settings** ────┐
+│
+│ Configure how many messages to boost
+│ when using "auto" mode:
+│
+└──────────────────────────────────┘
+
+**Current Setting:** {current_count} messages
+
+🎯 **Choose Message Count:**
+
+**1 Message** - Single latest message only
+**2 Messages** - Latest 2 messages  
+**5 Messages** - Latest 5 messages
+**10 Messages** - Latest 10 messages ⭐ **Default**
+**20 Messages** - Latest 20 messages
+
+💡 **Tip:** Lower counts are faster, higher counts give broader reach
+            """
+
+_REMOVE_CHANNEL_CONFIRM_TEXT = """
+🗑️ **Remove Channel**
+
+Are you sure you want to remove this channel?
+
+⚠️ **Warning:**
+• All boost history will be lost
+• You'll need to re-add it to boost again
+• Accounts will remain in the channel
+
+This action cannot be undone.
+            """
+
+_POLL_MANAGER_TEXT = """
+🗳️ <b>Poll Manager</b>
+
+Automatically vote in Telegram polls using your accounts.
+
+<b>How it works:</b>
+1. Get the poll URL/link from Telegram
+2. Select which option to vote for
+3. Bot uses all your accounts to vote
+
+<b>Supported:</b>
+• Channel polls
+• Group polls 
+• Public polls
+• Private polls (if accounts are members)
+
+Choose an option below:
+            """
+
+_POLL_START_TEXT = """
+🗳️ <b>Start Poll Voting</b>
+
+Please send me the poll URL or forward the poll message.
+
+<b>Supported formats:</b>
+• <code>https://t.me/channel/123</code>
+• <code>https://t.me/c/123456789/123</code>
+• Forward the poll message directly
+
+<b>Note:</b> Your accounts must have access to the channel/group containing the poll.
+            """
+
+_POLL_OPTIONS_TEXT = """
+🗳️ **Poll Found!**
+
+**Question:** {question}
+
+**Options:**
+{options}
+
+**Accounts available:** {accounts}
+
+Select which option you want to vote for:
+            """
+
+_POLL_PROGRESS_TEXT = """
+🗳️ **Starting Poll Vote**
+
+**Selected option:** {option}
+**Available accounts:** {accounts}
+
+⏳ **Voting in progress...**
+This may take a few moments.
+            """
+
+_LIVE_STOPPED_TEXT = """⏹️ **Live Monitoring Stopped**
+
+🔴 The live monitoring service has been stopped. No automatic scanning for live streams will occur.
+
+📊 **Status:**
+• Service: Inactive ❌
+• Auto-join: Disabled
+
+You can restart monitoring anytime by clicking "Start Monitoring"."""
+
+_LIVE_UNAVAILABLE_TEXT = """❌ **Monitoring Service Unavailable**
+
+The live monitoring service is temporarily unavailable. Please try again later."""
+
+_LIVE_STOP_FAILED_TEXT = """❌ **Failed to Stop Monitoring**
+
+There was an error stopping the live monitoring service."""
+
+_POLL_HISTORY_TEXT = """
+📋 <b>Poll History</b>
+
+<i>This feature will show your recent poll voting activity.</i>
+
+<b>Coming Soon:</b>
+• View recent poll votes
+• Vote statistics  
+• Success/failure rates
+• Account performance
+
+For now, all poll votes are logged in the system logs.
+            """
+
+_NO_CHANNELS_TEXT = "📋 <b>My Channels</b>\n\n❌ No channels added yet.\n\nUse 'Add Channel' to get started!"
+
+_BOOST_MENU_TEXT = """
+⚡ **Boost Views**
+
+Select a channel to boost:
+
+💡 **How it works:**
+• All active accounts will view your messages
+• Views are incremented automatically
+• Messages can be marked as read (optional)
+
+Choose a channel below:
+        """
+
+_ADD_CHANNEL_TEXT = """🎯 Add New Channel
+
+How it works:
+1. Send your Telegram channel link
+2. System will automatically join with accounts
+3. Start boosting views instantly!
+
+Accepted formats:
+• https://t.me/your_channel
+• https://t.me/joinchat/xxxxx
+• @your_channel_name
+• your_channel_name
+
+Features:
+• Auto-join with all accounts
+• Public and private channel support
+• Instant integration
+
+💬 Send your channel link or type /cancel to exit"""
+
+@dataclass(frozen=True, slots=True)
+class PollVote:
+    """The slice of a poll kept in FSM state until an option is chosen"""
+    message_url: str
+    message_id: int
+    options: Tuple[str, ...]
+
 class UserStates(StatesGroup):
     waiting_for_channel = State()
     waiting_for_message_ids = State()
@@ -31,15 +395,185 @@ class UserStates(StatesGroup):
     waiting_for_manual_message_ids = State()
     waiting_for_live_account_count = State()
 
-class UserHandler:
+class UserHandler(HandlerBase):
     """Handles user-specific operations"""
     
+    # Callback data -> (handler method name, handler takes the FSM context)
+    _EXACT_ROUTES = {
+        "main_menu": ("show_main_menu", False),
+        "user_panel": ("show_personal_dashboard", False),
+        "add_channel": ("start_add_channel", True),
+        "my_channels": ("show_my_channels", False),
+        "my_stats": ("show_my_stats", False),
+        "boost_views": ("show_boost_menu", False),
+        "emoji_reactions": ("show_emoji_reactions_menu", False),
+        "settings": ("show_settings", False),
+        "live_management": ("show_live_management", False),
+        "add_live_channel": ("start_add_live_channel", True),
+        "view_live_channels": ("show_live_channels", False),
+        "live_monitor_status": ("show_live_monitor_status", False),
+        "configure_live_accounts": ("show_live_account_selection", False),
+        "start_live_monitor": ("start_live_monitoring", False),
+        "stop_live_monitor": ("stop_live_monitoring", False),
+        "poll_manager": ("show_poll_manager", False),
+        "start_poll_voting": ("start_poll_voting", True),
+        "poll_history": ("show_poll_history", False),
+        "cancel_action": ("cancel_operation", True),
+        "cancel_operation": ("cancel_operation", True),
+    }
+    # "name:" prefix routes receive the text after the colon and are matched by name;
+    # the other prefixes receive the raw callback data and are checked in order
+    _PREFIX_ROUTES = (
+        ("live_channel_info:", "show_live_channel_info", False),
+        ("live_account_count:", "handle_live_account_selection", True),
+        ("remove_live_channel:", "confirm_remove_live_channel", False),
+        ("vote_option:", "execute_poll_vote", True),
+        ("channel_info:", "show_channel_info", False),
+        ("remove_channel:", "confirm_remove_channel", False),
+        ("instant_boost:", "start_instant_boost", True),
+        ("account_count_continue:", "show_view_count_selection", True),
+        ("view_count:", "handle_view_count_selection", True),
+        ("time_select:", "handle_time_selection", True),
+        ("auto_option:", "handle_auto_option_selection", True),
+        ("view_count_back:", "handle_view_count_back", True),
+        ("time_select_back:", "handle_time_select_back", True),
+        ("add_reactions:", "start_add_reactions", True),
+        ("boost_stats:", "show_boost_stats", False),
+        ("setting_", "handle_setting", False),
+        ("delay_", "handle_delay_setting", False),
+        ("auto_count_", "handle_auto_count_setting", False),
+        ("confirm:", "handle_confirmation", False),
+    )
+    # FSM state -> text message handler method name
+    _STATE_ROUTES = {
+        UserStates.waiting_for_channel.state: "process_add_channel",
+        UserStates.waiting_for_message_ids.state: "process_boost_messages",
+        UserStates.waiting_for_reaction_message_ids.state: "process_reaction_messages",
+        UserStates.waiting_for_live_channel.state: "process_live_channel",
+        UserStates.waiting_for_poll_url.state: "process_poll_url",
+        UserStates.waiting_for_custom_view_count.state: "process_custom_view_count",
+        UserStates.waiting_for_manual_message_ids.state: "process_manual_message_ids",
+        UserStates.waiting_for_live_account_count.state: "process_live_account_count",
+    }
+    
     def __init__(self, config: Config, db_manager: DatabaseManager, telethon_manager: TelethonManager, live_monitor=None):
         self.config = config
         self.db = db_manager
         self.telethon = telethon_manager
         self.live_monitor = live_monitor
         self.bot: Optional[Bot] = None  # Will be set by the main bot class
+        
+        # Bind the callback routes to this instance once
+        self._exact_routes = {
+            data: (getattr(self, handler_name), needs_state)
+            for data, (handler_name, needs_state) in self._EXACT_ROUTES.items()
+        }
+        # "name:arg" routes are looked up by name; the rest are scanned in order
+        self._colon_routes = {
+            prefix[:-1]: (getattr(self, handler_name), needs_state)
+            for prefix, handler_name, needs_state in self._PREFIX_ROUTES
+            if prefix.endswith(":")
+        }
+        self._prefix_routes = tuple(
+            (prefix, getattr(self, handler_name), needs_state)
+            for prefix, handler_name, needs_state in self._PREFIX_ROUTES
+            if not prefix.endswith(":")
+        )
+        self._prefixes = tuple(prefix for prefix, _, _ in self._prefix_routes)
+        self._state_handlers = {
+            state_name: getattr(self, handler_name)
+            for state_name, handler_name in self._STATE_ROUTES.items()
+        }
+        
+        # Short-lived per-user caches to skip repeated DB round-trips on callbacks
+        self._known_users: set = set()  # Users already registered by this process
+        # user_id -> (fetched, channels, channels by id)
+        self._channels_cache: Dict[int, Tuple[float, List[dict], Dict[int, dict]]] = {}
+        self._channels_locks: Dict[int, asyncio.Lock] = {}  # One DB fetch per user at a time
+        self._channels_version: Dict[int, int] = {}  # Bumped on every write so in-flight fetches can't cache stale rows
+        self._settings_cache: Dict[int, Tuple[float, dict]] = {}
+        self._bg_tasks: set = set()  # Fire-and-forget Telegram calls still in flight
+        # (chat_id, message_id) -> (text, parse_mode, reply_markup, text Telegram shows), least recent first
+        self._last_render: "OrderedDict[Tuple[int, int], tuple]" = OrderedDict()
+        # Recent message IDs fetched ahead of an "auto" boost: user_id -> (started, link, limit, task)
+        self._prefetch: Dict[int, Tuple[float, str, int, asyncio.Task]] = {}
+        # Escaped channel name snippets keyed by channel id; the raw name is kept to spot renames
+        self._channels_html_cache: Dict[int, Tuple[str, str]] = {}
+    
+    async def _ensure_user(self, user_id: int):
+        """Register the user once per process"""
+        if user_id in self._known_users:
+            return
+        if await self.db.add_user(user_id):
+            self._known_users.add(user_id)
+    
+    async def _get_user_channels(self, user_id: int, ttl: float = 30.0) -> List[dict]:
+        """Get user channels through a short TTL cache"""
+        cached = self._channels_cache.get(user_id)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        lock = self._channels_locks.setdefault(user_id, asyncio.Lock())
+        async with lock:
+            # Another callback may have refilled the cache while we waited
+            cached = self._channels_cache.get(user_id)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+            version = self._channels_version.get(user_id, 0)
+            channels = await self.db.get_user_channels(user_id)
+            # Menu label, resolved once per fetch instead of on every render
+            for channel in channels:
+                channel["display_name"] = channel.get("title") or Utils.truncate_text(channel["channel_link"])
+            if self._channels_version.get(user_id, 0) == version:
+                self._channels_cache[user_id] = (
+                    time.monotonic(), channels, {channel["id"]: channel for channel in channels}
+                )
+        return channels
+    
+    def _prefetch_message_ids(self, user_id: int, channel_link: str, limit: int):
+        """Start fetching recent message IDs while the user is still picking options"""
+        task = asyncio.ensure_future(self.telethon.get_channel_messages(channel_link, limit=limit))
+        # Retrieve the outcome so an unused prefetch never logs "exception was never retrieved"
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._prefetch[user_id] = (time.monotonic(), channel_link, limit, task)
+    
+    async def _recent_message_ids(self, user_id: int, channel_link: str, limit: int, max_age: float = 30.0) -> List[int]:
+        """Recent message IDs, reusing a matching prefetch when it is fresh enough"""
+        entry = self._prefetch.pop(user_id, None)
+        if entry:
+            started, prefetched_link, prefetched_limit, task = entry
+            if (prefetched_link == channel_link and prefetched_limit == limit
+                    and time.monotonic() - started < max_age):
+                try:
+                    message_ids = await task
+                    if message_ids:
+                        return message_ids
+                except Exception as e:
+                    logger.warning(f"Prefetched message IDs unavailable, fetching again: {e}")
+        return await self.telethon.get_channel_messages(channel_link, limit=limit)
+    
+    async def _get_user_channel(self, user_id: int, channel_id: int) -> Optional[dict]:
+        """Get one user channel, preferring a fresh cached channel list"""
+        cached = self._channels_cache.get(user_id)
+        if cached and time.monotonic() - cached[0] < 30.0:
+            channel = cached[2].get(channel_id)
+            if channel is not None:
+                return channel
+        return await self.db.get_channel(user_id, channel_id)
+    
+    def _channel_name_html(self, channel: dict) -> str:
+        """Bold, HTML-escaped channel name, escaped once per channel title; expects a cached channel"""
+        name = channel["display_name"]
+        cached = self._channels_html_cache.get(channel["id"])
+        if cached and cached[0] == name:
+            return cached[1]
+        snippet = f"<b>{html.escape(name)}</b>"
+        self._channels_html_cache[channel["id"]] = (name, snippet)
+        return snippet
+    
+    def _invalidate_channels(self, user_id: int):
+        """Drop cached channels after a write"""
+        self._channels_cache.pop(user_id, None)
+        self._channels_version[user_id] = self._channels_version.get(user_id, 0) + 1
     
     async def handle_callback(self, callback_query: types.CallbackQuery, state: FSMContext):
         """Handle user callback queries"""
@@ -51,86 +585,36 @@ class UserHandler:
         user_id = callback_query.from_user.id
         
         # Ensure user exists in database
-        await self.db.add_user(user_id)
-        
-        if data == "main_menu":
-            await self.show_main_menu(callback_query)
-        elif data == "user_panel":
-            await self.show_personal_dashboard(callback_query)
-        elif data == "add_channel":
-            await self.start_add_channel(callback_query, state)
-        elif data == "my_channels":
-            await self.show_my_channels(callback_query)
-        elif data == "my_stats":
-            await self.show_my_stats(callback_query)
-        elif data == "boost_views":
-            await self.show_boost_menu(callback_query)
-        elif data == "emoji_reactions":
-            await self.show_emoji_reactions_menu(callback_query)
-        elif data == "settings":
-            await self.show_settings(callback_query)
-        elif data == "live_management":
-            await self.show_live_management(callback_query)
-        elif data == "add_live_channel":
-            await self.start_add_live_channel(callback_query, state)
-        elif data == "view_live_channels":
-            await self.show_live_channels(callback_query)
-        elif data == "live_monitor_status":
-            await self.show_live_monitor_status(callback_query)
-        elif data.startswith("live_channel_info:"):
-            await self.show_live_channel_info(callback_query, data)
-        elif data == "configure_live_accounts":
-            await self.show_live_account_selection(callback_query)
-        elif data.startswith("live_account_count:"):
-            await self.handle_live_account_selection(callback_query, data, state)
-        elif data.startswith("remove_live_channel:"):
-            await self.confirm_remove_live_channel(callback_query, data)
-        elif data == "start_live_monitor":
-            await self.start_live_monitoring(callback_query)
-        elif data == "stop_live_monitor":
-            await self.stop_live_monitoring(callback_query)
-        elif data == "poll_manager":
-            await self.show_poll_manager(callback_query)
-        elif data == "start_poll_voting":
-            await self.start_poll_voting(callback_query, state)
-        elif data == "poll_history":
-            await self.show_poll_history(callback_query)
-        elif data.startswith("vote_option:"):
-            await self.execute_poll_vote(callback_query, data, state)
-        elif data.startswith("channel_info:"):
-            await self.show_channel_info(callback_query, data)
-        elif data.startswith("remove_channel:"):
-            await self.confirm_remove_channel(callback_query, data)
-        elif data.startswith("instant_boost:"):
-            await self.start_instant_boost(callback_query, data, state)
-        elif data.startswith("account_count_continue:"):
-            await self.show_view_count_selection(callback_query, data, state)
-        elif data.startswith("view_count:"):
-            await self.handle_view_count_selection(callback_query, data, state)
-        elif data.startswith("time_select:"):
-            await self.handle_time_selection(callback_query, data, state)
-        elif data.startswith("auto_option:"):
-            await self.handle_auto_option_selection(callback_query, data, state)
-        elif data.startswith("view_count_back:"):
-            await self.handle_view_count_back(callback_query, data, state)
-        elif data.startswith("time_select_back:"):
-            await self.handle_time_select_back(callback_query, data, state)
-        elif data.startswith("add_reactions:"):
-            await self.start_add_reactions(callback_query, data, state)
-        elif data.startswith("boost_stats:"):
-            await self.show_boost_stats(callback_query, data)
-        elif data.startswith("setting_"):
-            await self.handle_setting(callback_query, data)
-        elif data.startswith("delay_"):
-            await self.handle_delay_setting(callback_query, data)
-        elif data.startswith("auto_count_"):
-            await self.handle_auto_count_setting(callback_query, data)
-        elif data.startswith("confirm:"):
-            await self.handle_confirmation(callback_query, data)
-        elif data == "cancel_action" or data == "cancel_operation":
-            await self.cancel_operation(callback_query, state)
-        else:
-            await callback_query.answer("Unknown command")
+        await self._ensure_user(user_id)
+        
+        route = self._exact_routes.get(data)
+        if route:
+            handler, needs_state = route
+            if needs_state:
+                await handler(callback_query, state)
+            else:
+                await handler(callback_query)
+            return
+        
+        # "name:arg" routes get only the part after the name; the other prefixes get the raw data
+        name, sep, arg = data.partition(":")
+        route = self._colon_routes.get(name) if sep else None
+        if route is None and data.startswith(self._prefixes):
+            arg = data
+            route = next(
+                ((handler, needs_state) for prefix, handler, needs_state in self._prefix_routes
+                 if data.startswith(prefix)),
+                None
+            )
+        if route:
+            handler, needs_state = route
+            if needs_state:
+                await handler(callback_query, arg, state)
+            else:
+                await handler(callback_query, arg)
+            return
+        
+        await callback_query.answer("Unknown command")
     
     async def handle_message(self, message: types.Message, state: FSMContext):
         """Handle user text messages"""
@@ -138,22 +622,9 @@ class UserHandler:
             current_state = await state.get_state()
             logger.info(f"User message received in state: {current_state}")
             
-            if current_state == UserStates.waiting_for_channel.state:
-                await self.process_add_channel(message, state)
-            elif current_state == UserStates.waiting_for_message_ids.state:
-                await self.process_boost_messages(message, state)
-            elif current_state == UserStates.waiting_for_reaction_message_ids.state:
-                await self.process_reaction_messages(message, state)
-            elif current_state == UserStates.waiting_for_live_channel.state:
-                await self.process_live_channel(message, state)
-            elif current_state == UserStates.waiting_for_poll_url.state:
-                await self.process_poll_url(message, state)
-            elif current_state == UserStates.waiting_for_custom_view_count.state:
-                await self.process_custom_view_count(message, state)
-            elif current_state == UserStates.waiting_for_manual_message_ids.state:
-                await self.process_manual_message_ids(message, state)
-            elif current_state == UserStates.waiting_for_live_account_count.state:
-                await self.process_live_account_count(message, state)
+            handler = self._state_handlers.get(current_state)
+            if handler:
+                await handler(message, state)
             else:
                 logger.info(f"No handler for state: {current_state}")
         except Exception as e:
@@ -162,118 +633,44 @@ class UserHandler:
     
     async def show_main_menu(self, callback_query: types.CallbackQuery):
         """Show main menu"""
+        # Stop the client spinner before any DB or edit work
+        self._fire(callback_query.answer())
         user_id = callback_query.from_user.id
-        is_admin = self.config.is_admin(user_id)
-        
-        welcome_text = f"""
-🎯 **Professional View Booster**
-
-┌─────────────────────────┐
-│  Welcome, {callback_query.from_user.first_name}! 👋
-└─────────────────────────┘
-
-🔥 **Boost your Telegram channels with premium quality views**
-💎 **Powered by advanced automation technology**
-
-{'🛠 **Administrator Access** - Choose your management panel:' if is_admin else '⚡ **Ready to boost your content?** - Select an option below:'}
-        """
-        
-        try:
-            if callback_query.message:
-                await callback_query.message.edit_text(
-                    welcome_text,
-                    reply_markup=BotKeyboards.main_menu(is_admin),
-                    parse_mode="Markdown"
-                )
-            else:
-                await self.bot.send_message(
-                    callback_query.from_user.id,
-                    welcome_text,
-                    reply_markup=BotKeyboards.main_menu(is_admin),
-                    parse_mode="Markdown"
-                )
-        except Exception as e:
-            logger.error(f"Error editing main menu: {e}")
-            await callback_query.answer("Menu updated!", show_alert=False)
-        await callback_query.answer()
-    
-    async def show_personal_dashboard(self, callback_query: types.CallbackQuery):
-        """Show personal dashboard"""
-        user_id = callback_query.from_user.id
-        
-        # Get user stats
-        channels = await self.db.get_user_channels(user_id)
-        total_boosts = sum(channel.get("total_boosts", 0) for channel in channels)
-        
-        panel_text = f"""
-🎭 **Personal Dashboard**
-
-**Account Overview:**
-• Status: 🌟 Personal Admin Access
-• Channels: {len(channels)} (Unlimited)  
-• Total Boosts: {total_boosts:,} views
-
-💪 **Ready to amplify your reach?**
-🚀 **Choose your next action below:**
-        """
-        
-        try:
-            if callback_query.message:
-                await callback_query.message.edit_text(
-                    panel_text,
-                    reply_markup=BotKeyboards.main_menu(True),
-                    parse_mode="Markdown"
-                )
-            else:
-                await self.bot.send_message(
-                    callback_query.from_user.id,
-                    panel_text,
-                    reply_markup=BotKeyboards.main_menu(True),
-                    parse_mode="Markdown"
-                )
-        except Exception as e:
-            logger.error(f"Error editing dashboard: {e}")
-            await callback_query.answer("Dashboard updated!", show_alert=False)
-        await callback_query.answer()
+        is_admin = self.config.is_admin(user_id)
+        
+        template = _MAIN_MENU_ADMIN if is_admin else _MAIN_MENU_USER
+        welcome_text = template.format(name=callback_query.from_user.first_name)
+        
+        await self.safe_edit_message(callback_query, welcome_text, reply_markup=BotKeyboards.main_menu(is_admin), parse_mode="Markdown")
+    
+    async def show_personal_dashboard(self, callback_query: types.CallbackQuery):
+        """Show personal dashboard"""
+        self._fire(callback_query.answer())
+        user_id = callback_query.from_user.id
+        
+        # Reuse a fresh channel list if one is cached, otherwise let the DB aggregate
+        cached = self._channels_cache.get(user_id)
+        if cached and time.monotonic() - cached[0] < 30.0:
+            channel_count = len(cached[1])
+            total_boosts = sum(channel["total_boosts"] for channel in cached[1])
+        else:
+            channel_count, total_boosts = await self.db.get_user_channel_totals(user_id)
+        
+        panel_text = _DASHBOARD_TEXT.format(channel_count=channel_count, total_boosts=total_boosts)
+        
+        await self.safe_edit_message(callback_query, panel_text, reply_markup=BotKeyboards.main_menu(True), parse_mode="Markdown")
     
     async def start_add_channel(self, callback_query: types.CallbackQuery, state: FSMContext):
         """Start add channel process"""
+        self._fire(callback_query.answer())
         user_id = callback_query.from_user.id
         
         # Personal use - no limits
         
-        text = """🎯 Add New Channel
-
-How it works:
-1. Send your Telegram channel link
-2. System will automatically join with accounts
-3. Start boosting views instantly!
-
-Accepted formats:
-• https://t.me/your_channel
-• https://t.me/joinchat/xxxxx
-• @your_channel_name
-• your_channel_name
-
-Features:
-• Auto-join with all accounts
-• Public and private channel support
-• Instant integration
-
-💬 Send your channel link or type /cancel to exit"""
+        text = _ADD_CHANNEL_TEXT
         
         try:
-            if callback_query.message:
-                await callback_query.message.edit_text(
-                    text,
-                    reply_markup=BotKeyboards.cancel_operation()
-                )
-            else:
-                await self.bot.send_message(
-                    callback_query.from_user.id,
-                    text,
-                    reply_markup=BotKeyboards.cancel_operation()
-                )
+            await self._render(callback_query, text, BotKeyboards.cancel_operation(), parse_mode=None)
         except Exception as e:
             logger.error(f"Error starting add channel: {e}")
             # Send simple fallback message if editing fails
@@ -284,7 +681,6 @@ Features:
             )
         await state.set_state(UserStates.waiting_for_channel)
         logger.info(f"Set state to waiting_for_channel for user {user_id}")
-        await callback_query.answer()
     
     async def process_add_channel(self, message: types.Message, state: FSMContext):
         """Process add channel with link"""
@@ -299,15 +695,14 @@ Features:
                                reply_markup=BotKeyboards.main_menu(True))
             return
         
-        if not Utils.is_valid_telegram_link(channel_link):
+        normalized_link = Utils.parse_telegram_link(channel_link)
+        if not normalized_link:
             await message.answer(
                 "❌ Invalid channel link format. Please try again or /cancel\n\n" +
                 "Examples:\n• https://t.me/channel_name\n• @channel_name\n• channel_name"
             )
             return
         
-        normalized_link = Utils.normalize_telegram_link(channel_link)
-        
         # Show processing message
         processing_msg = await message.answer("⏳ Adding channel and joining with accounts...")
         
@@ -322,32 +717,33 @@ Features:
                     user_id=user_id,
                     channel_link=normalized_link,
                     channel_id=channel_id,
-                    title=join_message.split("joined ")[1] if "joined " in join_message else None
+                    title=join_message.partition("joined ")[2] or None
                 )
                 
                 if channel_added:
-                    await self.db.log_action(
+                    self._invalidate_channels(user_id)
+                    self.db.enqueue_log(
                         LogType.JOIN,
                         user_id=user_id,
                         message=f"User added channel: {normalized_link}"
                     )
                     
-                    await processing_msg.delete()
-                    await message.answer(
+                    await self._finish_processing(
+                        processing_msg, message,
                         f"✅ **Channel Added Successfully!**\n\n{join_message}\n\n" +
                         "You can now boost views for this channel.",
                         reply_markup=BotKeyboards.main_menu(True),
                         parse_mode="Markdown"
                     )
                 else:
-                    await processing_msg.delete()
-                    await message.answer(
+                    await self._finish_processing(
+                        processing_msg, message,
                         "⚠️ Channel joined but failed to save to database. Please try again.",
                         reply_markup=BotKeyboards.main_menu(True)
                     )
             else:
-                await processing_msg.delete()
-                await message.answer(
+                await self._finish_processing(
+                    processing_msg, message,
                     f"❌ **Failed to Add Channel**\n\n{join_message}\n\n" +
                     "Please check the channel link and try again.",
                     reply_markup=BotKeyboards.main_menu(True),
@@ -355,9 +751,9 @@ Features:
                 )
         
         except Exception as e:
-            await processing_msg.delete()
             logger.error(f"Error adding channel: {e}")
-            await message.answer(
+            await self._finish_processing(
+                processing_msg, message,
                 "❌ An error occurred while adding the channel. Please try again.",
                 reply_markup=BotKeyboards.main_menu(True)
             )
@@ -366,82 +762,50 @@ Features:
     
     async def show_my_channels(self, callback_query: types.CallbackQuery):
         """Show user's channels"""
+        self._fire(callback_query.answer())
         user_id = callback_query.from_user.id
-        channels = await self.db.get_user_channels(user_id)
+        channels = await self._get_user_channels(user_id)
         
         if not channels:
-            text = "📋 **My Channels**\n\n❌ No channels added yet.\n\nUse 'Add Channel' to get started!"
+            text = _NO_CHANNELS_TEXT
         else:
-            text = f"📋 **My Channels** ({len(channels)} total)\n\n"
-            for channel in channels:
-                name = channel.get("title") or Utils.truncate_text(channel["channel_link"])
-                boosts = channel.get("total_boosts", 0)
-                account_count = channel.get("account_count", 1)
-                last_boosted = Utils.format_datetime(channel.get("last_boosted"))
-                
-                text += f"📢 **{name}**\n"
-                text += f"   ⚡ Boosts: {boosts} | 👥 Accounts: {account_count}\n"
-                text += f"   📅 Last: {last_boosted}\n\n"
+            text = f"📋 <b>My Channels</b> ({len(channels)} total)\n\n" + "".join(
+                f"📢 {self._channel_name_html(channel)}\n"
+                f"   ⚡ Boosts: {channel.get('total_boosts', 0)} | 👥 Accounts: {channel.get('account_count', 1)}\n"
+                f"   📅 Last: {Utils.format_datetime(channel.get('last_boosted'))}\n\n"
+                for channel in channels
+            )
         
-        try:
-            if callback_query.message:
-                await callback_query.message.edit_text(
-                    text,
-                    reply_markup=BotKeyboards.channel_list(channels, user_id),
-                    parse_mode="Markdown"
-                )
-            else:
-                await self.bot.send_message(
-                    callback_query.from_user.id,
-                    text,
-                    reply_markup=BotKeyboards.channel_list(channels, user_id),
-                    parse_mode="Markdown"
-                )
-        except Exception as e:
-            logger.error(f"Error showing channels: {e}")
-            await callback_query.answer("Channels updated!", show_alert=False)
-        await callback_query.answer()
+        await self.safe_edit_message(callback_query, text, reply_markup=BotKeyboards.channel_list(channels, user_id), parse_mode="HTML")
     
     async def show_my_stats(self, callback_query: types.CallbackQuery):
         """Show user statistics"""
+        self._fire(callback_query.answer())
         user_id = callback_query.from_user.id
-        channels = await self.db.get_user_channels(user_id)
-        
-        total_boosts = sum(channel.get("total_boosts", 0) for channel in channels)
+        stats = await self.db.get_user_stats(user_id)
         
-        # Get recent boost logs for this user
-        recent_logs = await self.db.get_logs(limit=5, log_type=LogType.BOOST)
-        user_recent_logs = [log for log in recent_logs if log["user_id"] == user_id]
-        
-        stats_text = f"""
-📊 **My Statistics**
-
-👤 **Account Info:**
-Status: Personal Admin Access ⭐
-Member Since: {Utils.format_datetime(None)}
-
-📢 **Channel Stats:**
-Total Channels: {len(channels)} (Unlimited)
-Total Boosts: {total_boosts:,}
-
-📈 **Recent Activity:**
-        """
+        stats_text = _STATS_TEXT.format(
+            member_since=Utils.format_datetime(None),
+            channel_count=stats["channel_count"],
+            total_boosts=stats["total_boosts"]
+        )
         
-        if user_recent_logs:
-            for log in user_recent_logs[:3]:
+        parts = [stats_text]
+        if stats["recent_logs"]:
+            for log in stats["recent_logs"]:
                 timestamp = Utils.format_datetime(log["created_at"])
                 message = log["message"] or "Boost activity"
-                stats_text += f"⚡ {timestamp}: {Utils.truncate_text(message)}\n"
+                parts.append(f"⚡ {timestamp}: {Utils.truncate_text(message)}\n")
         else:
-            stats_text += "No recent activity"
+            parts.append("No recent activity")
         
-        if channels:
-            stats_text += f"\n📢 **Top Channels:**\n"
-            sorted_channels = sorted(channels, key=lambda x: x.get("total_boosts", 0), reverse=True)
-            for channel in sorted_channels[:3]:
-                name = channel.get("title") or Utils.truncate_text(channel["channel_link"])
-                boosts = channel.get("total_boosts", 0)
-                stats_text += f"• {name}: {boosts} boosts\n"
+        if stats["top_channels"]:
+            parts.append("\n📢 **Top Channels:**\n")
+            for channel in stats["top_channels"]:
+                name = channel["title"] or Utils.truncate_text(channel["channel_link"])
+                boosts = channel["total_boosts"] or 0
+                parts.append(f"• {name}: {boosts} boosts\n")
+        stats_text = "".join(parts)
         
         if callback_query.message:
             await callback_query.message.edit_text(
@@ -449,12 +813,11 @@ Total Boosts: {total_boosts:,}
                 reply_markup=BotKeyboards.back_button("main_menu"),
                 parse_mode="Markdown"
             )
-        await callback_query.answer()
     
     async def show_boost_menu(self, callback_query: types.CallbackQuery):
         """Show boost menu with user's channels"""
         user_id = callback_query.from_user.id
-        channels = await self.db.get_user_channels(user_id)
+        channels = await self._get_user_channels(user_id)
         
         if not channels:
             await callback_query.answer(
@@ -463,99 +826,56 @@ Total Boosts: {total_boosts:,}
             )
             return
         
-        text = f"""
-⚡ **Boost Views**
-
-Select a channel to boost:
-
-💡 **How it works:**
-• All active accounts will view your messages
-• Views are incremented automatically
-• Messages can be marked as read (optional)
-
-Choose a channel below:
-        """
+        text = _BOOST_MENU_TEXT
         
         # Create buttons for each channel
-        buttons = []
-        for channel in channels:
-            name = channel.get("title") or Utils.truncate_text(channel["channel_link"])
-            buttons.append([
-                types.InlineKeyboardButton(
-                    text=f"📢 {name}",
-                    callback_data=f"instant_boost:{channel['id']}"
-                )
-            ])
-        
+        buttons = [
+            [types.InlineKeyboardButton(text=f"📢 {channel['display_name']}", callback_data=f"instant_boost:{channel['id']}")]
+            for channel in channels
+        ]
         buttons.append([types.InlineKeyboardButton(text="🏠 Main Menu", callback_data="main_menu")])
         
         keyboard = types.InlineKeyboardMarkup(inline_keyboard=buttons)
         
-        try:
-            if callback_query.message:
-                await callback_query.message.edit_text(
-                    text,
-                    reply_markup=keyboard,
-                    parse_mode="Markdown"
-                )
-            else:
-                await self.bot.send_message(
-                    callback_query.from_user.id,
-                    text,
-                    reply_markup=keyboard,
-                    parse_mode="Markdown"
-                )
-        except Exception as e:
-            logger.error(f"Error showing boost menu: {e}")
-            await callback_query.answer("Boost menu updated!", show_alert=False)
+        await self.safe_edit_message(callback_query, text, reply_markup=keyboard, parse_mode="Markdown")
         await callback_query.answer()
     
-    async def start_instant_boost(self, callback_query: types.CallbackQuery, data: str, state: FSMContext):
+    async def start_instant_boost(self, callback_query: types.CallbackQuery, arg: str, state: FSMContext):
         """Start instant boost process - now shows account count first"""
         try:
-            channel_id = int(data.split(":")[1])
+            channel_id = int(arg)
             user_id = callback_query.from_user.id
             
-            # Get channel info
-            channels = await self.db.get_user_channels(user_id)
-            channel = next((ch for ch in channels if ch["id"] == channel_id), None)
+            # Channel, available accounts and auto count are independent lookups
+            channel, available_count, auto_count = await asyncio.gather(
+                self._get_user_channel(user_id, channel_id),
+                self.db.get_active_account_count(),
+                self.get_user_setting(user_id, "auto_message_count"),
+            )
             
             if not channel:
                 await callback_query.answer("❌ Channel not found", show_alert=True)
                 return
             
-            # Get available account count
-            active_accounts = await self.db.get_active_accounts()
-            available_count = len(active_accounts)
-            
             if available_count == 0:
                 await callback_query.answer("❌ No active accounts available", show_alert=True)
                 return
             
-            # Store channel info in state
-            await state.update_data(
-                boost_channel_id=channel_id, 
-                boost_channel_link=channel["channel_link"],
-                feature_type="boost",
-                available_accounts=available_count
-            )
+            # Overlap the recent-messages lookup with the option menus in case "auto" is chosen
+            if auto_count and auto_count > 0:
+                self._prefetch_message_ids(user_id, channel["channel_link"], auto_count)
             
-            text = f"""
-📊 **Account Status**
-
-Channel: {channel.get("title") or channel["channel_link"]}
-
-💯 **Available Accounts:** {available_count:,}
-
-📝 **How it works:**
-• Each account will view your selected messages
-• Views are distributed across the timeframe you choose
-• You can select how many views you want
-• Choose between auto-detection or manual message selection
-
-🚀 **Ready to continue?**
-Click Continue to select the number of views you want.
-            """
+            # Store channel info in state; a new boost flow starts from fresh data
+            await state.set_data({
+                "boost_channel_id": channel_id,
+                "boost_channel_link": channel["channel_link"],
+                "feature_type": "boost",
+                "available_accounts": available_count,
+            })
+            
+            text = _BOOST_ACCOUNTS_TEXT.format(
+                channel_name=channel.get("title") or channel["channel_link"], available_count=available_count
+            )
             
             if callback_query.message:
                 await callback_query.message.edit_text(
@@ -569,23 +889,15 @@ Click Continue to select the number of views you want.
             logger.error(f"Error starting instant boost: {e}")
             await callback_query.answer("❌ Error starting boost", show_alert=True)
     
-    async def show_view_count_selection(self, callback_query: types.CallbackQuery, data: str, state: FSMContext):
+    async def show_view_count_selection(self, callback_query: types.CallbackQuery, arg: str, state: FSMContext):
         """Show view count selection based on available accounts"""
         try:
-            feature_type = data.split(":")[1]
+            feature_type = arg
             state_data = await state.get_data()
             available_accounts = state_data.get("available_accounts", 0)
             channel_link = state_data.get("boost_channel_link", "Unknown")
             
-            text = f"""
-📊 **Select View Count**
-
-Channel: {channel_link}
-💯 Available Accounts: {available_accounts:,}
-
-🎯 **Choose how many views you want:**
-Select from the options below based on your available accounts.
-            """
+            text = _VIEW_COUNT_TEXT.format(channel_link=channel_link, available_accounts=available_accounts)
             
             await callback_query.message.edit_text(
                 text,
@@ -598,25 +910,19 @@ Select from the options below based on your available accounts.
             logger.error(f"Error showing view count selection: {e}")
             await callback_query.answer("❌ Error showing view count options", show_alert=True)
     
-    async def handle_view_count_selection(self, callback_query: types.CallbackQuery, data: str, state: FSMContext):
+    async def handle_view_count_selection(self, callback_query: types.CallbackQuery, arg: str, state: FSMContext):
         """Handle view count selection"""
         try:
-            parts = data.split(":")
-            feature_type = parts[1]
-            view_count_str = parts[2]
+            parts = arg.split(":")
+            feature_type = parts[0]
+            view_count_str = parts[1]
             
             state_data = await state.get_data()
             available_accounts = state_data.get("available_accounts", 0)
             
             if view_count_str == "custom":
                 # Handle custom view count input
-                text = f"""
-✏️ **Custom View Count**
-
-💯 Available Accounts: {available_accounts:,}
-
-Enter the number of views you want (up to {available_accounts:,}):
-                """
+                text = _CUSTOM_VIEW_COUNT_TEXT.format(available_accounts=available_accounts)
                 
                 await callback_query.message.edit_text(
                     text,
@@ -637,15 +943,9 @@ Enter the number of views you want (up to {available_accounts:,}):
             # Store view count and proceed to time selection
             await state.update_data(selected_view_count=view_count)
             
-            text = f"""
-⏰ **Select Time Frame**
-
-📊 Views Selected: {view_count:,}
-📢 Channel: {state_data.get("boost_channel_link", "Unknown")}
-
-🕒 **Choose time frame for the views:**
-Select how quickly you want the views to be delivered.
-            """
+            text = _TIME_FRAME_TEXT.format(
+                view_count=view_count, channel_link=state_data.get("boost_channel_link", "Unknown")
+            )
             
             await callback_query.message.edit_text(
                 text,
@@ -658,13 +958,13 @@ Select how quickly you want the views to be delivered.
             logger.error(f"Error handling view count selection: {e}")
             await callback_query.answer("❌ Error processing view count", show_alert=True)
     
-    async def handle_time_selection(self, callback_query: types.CallbackQuery, data: str, state: FSMContext):
+    async def handle_time_selection(self, callback_query: types.CallbackQuery, arg: str, state: FSMContext):
         """Handle time selection"""
         try:
-            parts = data.split(":")
-            feature_type = parts[1]
-            view_count = int(parts[2])
-            time_minutes = int(parts[3])
+            parts = arg.split(":")
+            feature_type = parts[0]
+            view_count = int(parts[1])
+            time_minutes = int(parts[2])
             
             # Store time selection and proceed to auto/manual options
             await state.update_data(selected_time_minutes=time_minutes)
@@ -673,18 +973,10 @@ Select how quickly you want the views to be delivered.
             
             time_text = "Instant" if time_minutes == 0 else f"{time_minutes} minutes"
             
-            text = f"""
-🎯 **Choose Mode**
-
-📊 Views: {view_count:,}
-⏰ Time Frame: {time_text}
-📢 Channel: {state_data.get("boost_channel_link", "Unknown")}
-
-🤖 **Auto Mode:** Automatically boost the latest messages
-✋ **Manual Mode:** Choose specific message IDs
-
-Select your preferred mode:
-            """
+            text = _CHOOSE_MODE_TEXT.format(
+                view_count=view_count, time_text=time_text,
+                channel_link=state_data.get("boost_channel_link", "Unknown")
+            )
             
             await callback_query.message.edit_text(
                 text,
@@ -697,29 +989,29 @@ Select your preferred mode:
             logger.error(f"Error handling time selection: {e}")
             await callback_query.answer("❌ Error processing time selection", show_alert=True)
     
-    async def handle_auto_option_selection(self, callback_query: types.CallbackQuery, data: str, state: FSMContext):
+    async def handle_auto_option_selection(self, callback_query: types.CallbackQuery, arg: str, state: FSMContext):
         """Handle auto/manual option selection with improved state management"""
         try:
-            parts = data.split(":")
-            if len(parts) != 5:
+            parts = arg.split(":")
+            if len(parts) != 4:
                 await callback_query.answer("❌ Invalid selection data", show_alert=True)
                 return
             
-            feature_type = parts[1]
+            feature_type = parts[0]
             if feature_type not in ["boost", "reactions"]:
                 await callback_query.answer("❌ Invalid feature type", show_alert=True)
                 return
             
             try:
-                view_count = int(parts[2])
-                time_minutes = int(parts[3])
+                view_count = int(parts[1])
+                time_minutes = int(parts[2])
                 if view_count <= 0 or time_minutes < 0:
                     raise ValueError("Invalid counts")
             except ValueError:
                 await callback_query.answer("❌ Invalid count values", show_alert=True)
                 return
             
-            mode = parts[4]
+            mode = parts[3]
             if mode not in ["auto", "manual"]:
                 await callback_query.answer("❌ Invalid mode selection", show_alert=True)
                 return
@@ -745,17 +1037,20 @@ Select your preferred mode:
                 await state.clear()  # Clear potentially corrupted state
                 return
                 
-            # Ensure all required state data is present and restore if needed
+            # Ensure all required state data is present and restore it in one write
+            restored = {}
             if not state_data.get("feature_type"):
-                await state.update_data(feature_type=feature_type)
+                restored["feature_type"] = feature_type
             if not state_data.get("selected_view_count"):
-                await state.update_data(selected_view_count=view_count)
+                restored["selected_view_count"] = view_count
             if not state_data.get("selected_time_minutes"):
-                await state.update_data(selected_time_minutes=time_minutes)
+                restored["selected_time_minutes"] = time_minutes
             if not state_data.get("available_accounts"):
                 # Get account count to ensure state consistency
-                available_accounts = await self.db.get_active_account_count()
-                await state.update_data(available_accounts=available_accounts)
+                restored["available_accounts"] = await self.db.get_active_account_count()
+            if restored:
+                state_data.update(restored)
+                await state.set_data(state_data)
             
             logger.info(f"✅ State validation complete for {feature_type} with {view_count} views over {time_minutes} minutes")
             
@@ -768,7 +1063,7 @@ Select your preferred mode:
                     # Save the default setting for the user
                     await self.set_user_setting(user_id, "auto_message_count", auto_count)
                 
-                message_ids = await self.telethon.get_channel_messages(channel_link, limit=auto_count)
+                message_ids = await self._recent_message_ids(user_id, channel_link, auto_count)
                 
                 if not message_ids:
                     await callback_query.answer("❌ Could not find recent messages in the channel.", show_alert=True)
@@ -790,22 +1085,10 @@ Select your preferred mode:
             else:
                 # Manual mode - ask for message IDs
                 action_type = "Views" if feature_type == "boost" else "Reactions"
-                text = f"""
-✏️ **Manual Message Selection**
-
-📊 {action_type}: {view_count:,}
-⏰ Time Frame: {"Instant" if time_minutes == 0 else f"{time_minutes} minutes"}
-
-Send message IDs or message links separated by commas or spaces.
-
-**Examples:**
-• 123, 124, 125
-• 100 101 102
-• 50-55 (range)
-• https://t.me/channel/123
-
-Send your message IDs now:
-                """
+                text = _MANUAL_IDS_TEXT.format(
+                    action_type=action_type, view_count=view_count,
+                    time_text="Instant" if time_minutes == 0 else f"{time_minutes} minutes"
+                )
                 
                 await callback_query.message.edit_text(
                     text,
@@ -819,10 +1102,10 @@ Send your message IDs now:
             logger.error(f"Error handling auto option selection: {e}")
             await callback_query.answer("❌ Error processing selection", show_alert=True)
     
-    async def handle_view_count_back(self, callback_query: types.CallbackQuery, data: str, state: FSMContext):
+    async def handle_view_count_back(self, callback_query: types.CallbackQuery, arg: str, state: FSMContext):
         """Handle back button from view count selection to account count display"""
         try:
-            feature_type = data.split(":")[1]
+            feature_type = arg
             state_data = await state.get_data()
             available_accounts = state_data.get("available_accounts", 0)
             channel_link = state_data.get("boost_channel_link" if feature_type == "boost" else "reaction_channel_link")
@@ -857,24 +1140,18 @@ Click Continue to select the number of {'views' if feature_type == 'boost' else
             logger.error(f"Error handling view count back: {e}")
             await callback_query.answer("❌ Error going back", show_alert=True)
     
-    async def handle_time_select_back(self, callback_query: types.CallbackQuery, data: str, state: FSMContext):
+    async def handle_time_select_back(self, callback_query: types.CallbackQuery, arg: str, state: FSMContext):
         """Handle back button from auto options to time selection"""
         try:
-            parts = data.split(":")
-            feature_type = parts[1]
-            view_count = int(parts[2])
+            parts = arg.split(":")
+            feature_type = parts[0]
+            view_count = int(parts[1])
             
             state_data = await state.get_data()
             
-            text = f"""
-⏰ **Select Time Frame**
-
-📊 Views Selected: {view_count:,}
-📢 Channel: {state_data.get("boost_channel_link", "Unknown")}
-
-🕒 **Choose time frame for the views:**
-Select how quickly you want the views to be delivered.
-            """
+            text = _TIME_FRAME_TEXT.format(
+                view_count=view_count, channel_link=state_data.get("boost_channel_link", "Unknown")
+            )
             
             await callback_query.message.edit_text(
                 text,
@@ -887,52 +1164,37 @@ Select how quickly you want the views to be delivered.
             logger.error(f"Error handling time select back: {e}")
             await callback_query.answer("❌ Error going back", show_alert=True)
 
-    async def start_add_reactions(self, callback_query: types.CallbackQuery, data: str, state: FSMContext):
+    async def start_add_reactions(self, callback_query: types.CallbackQuery, arg: str, state: FSMContext):
         """Start emoji reactions process - now shows account count first"""
         try:
-            channel_id = int(data.split(":")[1])
+            channel_id = int(arg)
             user_id = callback_query.from_user.id
             
             # Get channel info
-            channels = await self.db.get_user_channels(user_id)
-            channel = next((ch for ch in channels if ch["id"] == channel_id), None)
+            channel = await self._get_user_channel(user_id, channel_id)
             
             if not channel:
                 await callback_query.answer("❌ Channel not found", show_alert=True)
                 return
             
             # Get available account count
-            active_accounts = await self.db.get_active_accounts()
-            available_count = len(active_accounts)
+            available_count = await self.db.get_active_account_count()
             
             if available_count == 0:
                 await callback_query.answer("❌ No active accounts available", show_alert=True)
                 return
             
-            # Store channel info in state
-            await state.update_data(
-                reaction_channel_id=channel_id, 
-                reaction_channel_link=channel["channel_link"],
-                feature_type="reactions",
-                available_accounts=available_count
-            )
+            # Store channel info in state; a new reaction flow starts from fresh data
+            await state.set_data({
+                "reaction_channel_id": channel_id,
+                "reaction_channel_link": channel["channel_link"],
+                "feature_type": "reactions",
+                "available_accounts": available_count,
+            })
             
-            text = f"""
-📊 **Account Status**
-
-Channel: {channel.get("title") or channel["channel_link"]}
-
-💯 **Available Accounts:** {available_count:,}
-
-😍 **How it works:**
-• Each account reacts with a random emoji
-• Accounts cycle through messages based on your selection
-• Popular emojis: ❤️ 👍 😂 🔥 💯 🎉 😍 and more!
-• You can choose how many reactions and timing
-
-🚀 **Ready to continue?**
-Click Continue to select the number of reactions you want.
-            """
+            text = _REACTION_ACCOUNTS_TEXT.format(
+                channel_name=channel.get("title") or channel["channel_link"], available_count=available_count
+            )
             
             if callback_query.message:
                 await callback_query.message.edit_text(
@@ -970,14 +1232,16 @@ Click Continue to select the number of reactions you want.
             await state.clear()
             return
         
+        settings = await self.get_user_settings(user_id, ("auto_message_count", "views_only"))
+        
         # Process message IDs
         if input_text.lower() == "auto":
             # Auto-detect recent messages using user's setting
-            auto_count = await self.get_user_setting(user_id, "auto_message_count")
+            auto_count = settings["auto_message_count"]
             if auto_count is None:
                 auto_count = 10  # Only use default if setting doesn't exist
             logger.info(f"🔍 DEBUG: User {user_id} auto_count setting retrieved: {auto_count}")
-            message_ids = await self.telethon.get_channel_messages(channel_link, limit=auto_count)
+            message_ids = await self._recent_message_ids(user_id, channel_link, auto_count)
             if not message_ids:
                 await message.answer("❌ Could not find recent messages in the channel.")
                 return
@@ -989,7 +1253,7 @@ Click Continue to select the number of reactions you want.
                 return
         
         # Get user settings
-        mark_as_read = not await self.get_user_setting(user_id, "views_only")
+        mark_as_read = not settings["views_only"]
         
         # Show processing message
         processing_msg = await message.answer(
@@ -997,41 +1261,49 @@ Click Continue to select the number of reactions you want.
             f"{'📖 Views + Read' if mark_as_read else '👁️ Views Only'}"
         )
         
+        header = processing_msg.text
+        
+        async def report_progress(done: int, total: int):
+            # Edit every few accounts and on the last one to stay under edit limits
+            if done == total or done % 5 == 0:
+                await processing_msg.edit_text(f"{header}\n\n🔄 Accounts done: {done}/{total}")
+        
         try:
             # Perform boost
             success, boost_message, boost_count = await self.telethon.boost_views(
-                channel_link, message_ids, mark_as_read
+                channel_link, message_ids, mark_as_read, progress_callback=report_progress
             )
             
-            await processing_msg.delete()
-            
             if success:
                 # Update database
                 await self.db.update_channel_boost(channel_id, boost_count)
-                await self.db.log_action(
+                self._invalidate_channels(user_id)
+                self.db.enqueue_log(
                     LogType.BOOST,
                     user_id=user_id,
                     channel_id=channel_id,
                     message=f"Boosted {boost_count} views"
                 )
                 
-                await message.answer(
+                await self._finish_processing(
+                    processing_msg, message,
                     f"✅ **Boost Completed!**\n\n{boost_message}\n\n" +
                     f"Message IDs: {', '.join(map(str, message_ids))}",
                     reply_markup=BotKeyboards.main_menu(True),
                     parse_mode="Markdown"
                 )
             else:
-                await message.answer(
+                await self._finish_processing(
+                    processing_msg, message,
                     f"❌ **Boost Failed**\n\n{boost_message}",
                     reply_markup=BotKeyboards.main_menu(True),
                     parse_mode="Markdown"
                 )
         
         except Exception as e:
-            await processing_msg.delete()
             logger.error(f"Error boosting messages: {e}")
-            await message.answer(
+            await self._finish_processing(
+                processing_msg, message,
                 "❌ An error occurred during boost. Please try again.",
                 reply_markup=BotKeyboards.main_menu(True)
             )
@@ -1091,24 +1363,21 @@ Click Continue to select the number of reactions you want.
                 channel_link, message_ids
             )
             
-            try:
-                await processing_msg.delete()
-            except Exception:
-                pass  # Ignore message deletion errors
-            
             if success:
                 # Update channel boost count (treat reactions as boosts in stats)
                 await self.db.update_channel_boost(channel_id, reaction_count)
+                self._invalidate_channels(user_id)
                 
                 # Log the action
-                await self.db.log_action(
+                self.db.enqueue_log(
                     LogType.BOOST,
                     user_id=user_id,
                     channel_id=channel_id,
                     message=f"Added {reaction_count} emoji reactions to messages: {message_ids[:5]}"
                 )
                 
-                await message.answer(
+                await self._finish_processing(
+                    processing_msg, message,
                     f"🎉 **Reactions Complete!**\n\n"
                     f"✨ **Results:**\n"
                     f"{result_message}\n\n"
@@ -1117,7 +1386,8 @@ Click Continue to select the number of reactions you want.
                     parse_mode="Markdown"
                 )
             else:
-                await message.answer(
+                await self._finish_processing(
+                    processing_msg, message,
                     f"❌ **Reactions Failed**\n\n{result_message}\n\n"
                     f"💡 Try adding more active accounts or check account health.",
                     reply_markup=BotKeyboards.main_menu(True),
@@ -1125,12 +1395,9 @@ Click Continue to select the number of reactions you want.
                 )
         
         except Exception as e:
-            try:
-                await processing_msg.delete()
-            except Exception:
-                pass  # Ignore message deletion errors
             logger.error(f"Error adding reactions: {e}")
-            await message.answer(
+            await self._finish_processing(
+                processing_msg, message,
                 "❌ An error occurred during reactions. Please try again.",
                 reply_markup=BotKeyboards.main_menu(True)
             )
@@ -1143,7 +1410,7 @@ Click Continue to select the number of reactions you want.
             user_id = callback_query.from_user.id
             
             # Get user channels
-            channels = await self.db.get_user_channels(user_id)
+            channels = await self._get_user_channels(user_id)
             
             text = """
 🎭 **Emoji Reactions Hub**
@@ -1190,131 +1457,45 @@ Select a channel below to start:
                     text,
                     reply_markup=keyboard,
                     parse_mode="Markdown"
-                )
-            await callback_query.answer()
-            
-        except Exception as e:
-            logger.error(f"Error showing emoji reactions menu: {e}")
-            await callback_query.answer("❌ Error loading reactions menu", show_alert=True)
-    
-    async def show_settings(self, callback_query: types.CallbackQuery):
-        """Show user settings"""
-        user_id = callback_query.from_user.id
-        
-        try:
-            delay_level = await self.get_user_setting(user_id, "delay_level")
-            
-            # Provide default value if None
-            delay_level = delay_level if delay_level is not None else "medium"
-            
-            # Ensure delay_level is a valid string
-            if not isinstance(delay_level, str) or delay_level not in ["low", "medium", "high"]:
-                delay_level = "medium"
-            
-            delay_range = Utils.get_delay_range(delay_level)
-            
-            text = f"""
-⚙️ **Advanced Configuration**
-
-┌──── ⏱️ **Performance Settings** ────┐
-│ 
-│ 🎯 **Boost Timing:**
-│ → Current: {delay_level.title()} Speed
-│ → Interval: {delay_range[0]}-{delay_range[1]} seconds
-│ 
-│ 🤖 **Smart Automation:**
-│ → Account Rotation: ✅ Active
-│ → Message Reading: ✅ Enabled
-│ → Performance Mode: 🚀 Optimized
-│
-└────────────────────────────────────┘
-
-💡 **Tip:** Our AI manages accounts automatically for maximum efficiency
-            """
+                )
+            await callback_query.answer()
             
-            # Handle message editing with complete error suppression
-            if callback_query.message:
-                try:
-                    await callback_query.message.edit_text(
-                        text,
-                        reply_markup=BotKeyboards.settings_menu(),
-                        parse_mode="Markdown"
-                    )
-                except Exception as edit_error:
-                    if "message is not modified" in str(edit_error):
-                        # Completely ignore this harmless error
-                        pass
-                    else:
-                        # Log other errors but don't raise them
-                        logger.warning(f"Non-critical message edit error: {edit_error}")
+        except Exception as e:
+            logger.error(f"Error showing emoji reactions menu: {e}")
+            await callback_query.answer("❌ Error loading reactions menu", show_alert=True)
+    
+    async def show_settings(self, callback_query: types.CallbackQuery):
+        """Show user settings"""
+        self._fire(callback_query.answer())
+        user_id = callback_query.from_user.id
+        
+        try:
+            delay_level = await self.get_user_setting(user_id, "delay_level")
             
-            await callback_query.answer()
+            # Fall back to medium for missing or malformed stored values
+            if not isinstance(delay_level, str) or delay_level not in DELAY_RANGES:
+                delay_level = "medium"
+            delay_min, delay_max = DELAY_RANGES[delay_level]
+            
+            text = _SETTINGS_TEXT.format(delay_level=delay_level.title(), delay_min=delay_min, delay_max=delay_max)
+            
+            # Skips the edit when the message already shows these settings
+            await self.safe_edit_message(callback_query, text, BotKeyboards.settings_menu(), "Markdown")
             
         except Exception as e:
-            # Only log truly unexpected errors
-            if "message is not modified" not in str(e):
-                logger.error(f"Error showing settings: {e}")
-            await callback_query.answer()
+            logger.error(f"Error showing settings: {e}")
     
     async def handle_setting(self, callback_query: types.CallbackQuery, data: str):
         """Handle setting changes"""
         user_id = callback_query.from_user.id
         
         if data == "setting_delay":
-            text = """
-⚡ **Performance Optimization Center**
-
-┌──── 🎯 **Speed Configuration** ────┐
-│
-│ Choose your preferred performance level:
-│
-└───────────────────────────────────┘
-
-🚀 **Fast Mode (1-2s)**
-   → Maximum speed delivery
-   → Higher engagement rate
-   → Ideal for trending content
-
-⚡ **Balanced Mode (2-5s)** ⭐ **Recommended**
-   → Optimal speed vs safety ratio
-   → Best overall performance
-   → Professional standard
-
-🛡️ **Safe Mode (5-10s)**
-   → Maximum account protection
-   → Conservative approach
-   → Long-term stability focus
-
-💡 **Pro Tip:** Balanced mode offers the best results for most campaigns
-            """
-            
-            await self.safe_edit_message(callback_query, text, BotKeyboards.delay_settings(), "Markdown")
+            await self.safe_edit_message(callback_query, _DELAY_CONFIG_TEXT, BotKeyboards.delay_settings(), "Markdown")
             await callback_query.answer()
         
         elif data == "setting_auto_count":
             current_count = await self.get_user_setting(user_id, "auto_message_count") or 10
-            text = f"""
-📊 **Auto Message Count Configuration**
-
-┌──── 🎯 **Auto Mode Settings** ────┐
-│
-│ Configure how many messages to boost
-│ when using "auto" mode:
-│
-└──────────────────────────────────┘
-
-**Current Setting:** {current_count} messages
-
-🎯 **Choose Message Count:**
-
-**1 Message** - Single latest message only
-**2 Messages** - Latest 2 messages  
-**5 Messages** - Latest 5 messages
-**10 Messages** - Latest 10 messages ⭐ **Default**
-**20 Messages** - Latest 20 messages
-
-💡 **Tip:** Lower counts are faster, higher counts give broader reach
-            """
+            text = _AUTO_COUNT_TEXT.format(current_count=current_count)
             
             await self.safe_edit_message(callback_query, text, BotKeyboards.auto_count_settings(), "Markdown")
             await callback_query.answer()
@@ -1327,21 +1508,10 @@ Select a channel below to start:
         """Handle delay setting changes"""
         user_id = callback_query.from_user.id
         
-        delay_map = {
-            "delay_low": "low",
-            "delay_medium": "medium", 
-            "delay_high": "high"
-        }
-        
-        delay_level = delay_map.get(data)
+        delay_level = _DELAY_LEVELS.get(data)
         if delay_level:
             await self.update_user_setting(user_id, "delay_level", delay_level)
-            responses = {
-                "low": "🚀 Fast Mode activated - Maximum speed enabled!",
-                "medium": "⚡ Balanced Mode activated - Optimal performance!", 
-                "high": "🛡️ Safe Mode activated - Maximum protection!"
-            }
-            await callback_query.answer(responses.get(delay_level, "✨ Settings updated!"))
+            await callback_query.answer(_DELAY_RESPONSES.get(delay_level, "✨ Settings updated!"))
             await self.show_settings(callback_query)
     
     async def handle_auto_count_setting(self, callback_query: types.CallbackQuery, data: str):
@@ -1367,14 +1537,13 @@ Select a channel below to start:
         else:
             logger.error(f"🔧 DEBUG: No count found for data: {data}")
     
-    async def show_channel_info(self, callback_query: types.CallbackQuery, data: str):
+    async def show_channel_info(self, callback_query: types.CallbackQuery, arg: str):
         """Show detailed channel information"""
         try:
-            channel_id = int(data.split(":")[1])
+            channel_id = int(arg)
             user_id = callback_query.from_user.id
             
-            channels = await self.db.get_user_channels(user_id)
-            channel = next((ch for ch in channels if ch["id"] == channel_id), None)
+            channel = await self._get_user_channel(user_id, channel_id)
             
             if not channel:
                 await callback_query.answer("❌ Channel not found", show_alert=True)
@@ -1418,26 +1587,13 @@ Select a channel below to start:
             logger.error(f"Error showing channel info: {e}")
             await callback_query.answer("❌ Error loading channel info", show_alert=True)
     
-    async def confirm_remove_channel(self, callback_query: types.CallbackQuery, data: str):
+    async def confirm_remove_channel(self, callback_query: types.CallbackQuery, arg: str):
         """Confirm channel removal"""
         try:
-            channel_id = int(data.split(":")[1])
-            
-            text = """
-🗑️ **Remove Channel**
-
-Are you sure you want to remove this channel?
-
-⚠️ **Warning:**
-• All boost history will be lost
-• You'll need to re-add it to boost again
-• Accounts will remain in the channel
-
-This action cannot be undone.
-            """
+            channel_id = int(arg)
             
             await callback_query.message.edit_text(
-                text,
+                _REMOVE_CHANNEL_CONFIRM_TEXT,
                 reply_markup=BotKeyboards.confirm_action("remove_channel", str(channel_id)),
                 parse_mode="Markdown"
             )
@@ -1447,12 +1603,12 @@ This action cannot be undone.
             logger.error(f"Error confirming channel removal: {e}")
             await callback_query.answer("❌ Error", show_alert=True)
     
-    async def handle_confirmation(self, callback_query: types.CallbackQuery, data: str):
+    async def handle_confirmation(self, callback_query: types.CallbackQuery, arg: str):
         """Handle confirmation actions"""
         try:
-            parts = data.split(":")
-            action = parts[1]
-            item_id = parts[2]
+            parts = arg.split(":")
+            action = parts[0]
+            item_id = parts[1]
             user_id = callback_query.from_user.id
             
             if action == "remove_channel":
@@ -1460,6 +1616,7 @@ This action cannot be undone.
                 success = await self.db.remove_channel(channel_id, user_id)
                 
                 if success:
+                    self._invalidate_channels(user_id)
                     await callback_query.answer("✅ Channel removed successfully")
                     await self.show_my_channels(callback_query)
                 else:
@@ -1469,14 +1626,13 @@ This action cannot be undone.
             logger.error(f"Error handling confirmation: {e}")
             await callback_query.answer("❌ Error processing action", show_alert=True)
     
-    async def show_boost_stats(self, callback_query: types.CallbackQuery, data: str):
+    async def show_boost_stats(self, callback_query: types.CallbackQuery, arg: str):
         """Show boost statistics for a channel"""
         try:
-            channel_id = int(data.split(":")[1])
+            channel_id = int(arg)
             user_id = callback_query.from_user.id
             
-            channels = await self.db.get_user_channels(user_id)
-            channel = next((ch for ch in channels if ch["id"] == channel_id), None)
+            channel = await self._get_user_channel(user_id, channel_id)
             
             if not channel:
                 await callback_query.answer("❌ Channel not found", show_alert=True)
@@ -1488,8 +1644,7 @@ This action cannot be undone.
             created = Utils.format_datetime(channel.get("created_at"))
             
             # Get recent boost logs for this channel
-            recent_logs = await self.db.get_logs(limit=10, log_type=LogType.BOOST)
-            channel_logs = [log for log in recent_logs if log.get("channel_id") == channel_id]
+            channel_logs = await self.db.get_logs(limit=5, log_type=LogType.BOOST, channel_id=channel_id)
             
             text = f"""
 📊 **Boost Statistics**
@@ -1505,10 +1660,11 @@ Last Boosted: {last_boosted}
             """
             
             if channel_logs:
-                for log in channel_logs[:5]:
-                    timestamp = Utils.format_datetime(log["created_at"])
-                    message = log["message"] or "Boost activity"
-                    text += f"⚡ {timestamp}: {Utils.truncate_text(message)}\n"
+                text += "".join(
+                    f"⚡ {Utils.format_datetime(log['created_at'])}: "
+                    f"{Utils.truncate_text(log['message'] or 'Boost activity')}\n"
+                    for log in channel_logs
+                )
             else:
                 text += "No recent boost activity"
             
@@ -1532,84 +1688,72 @@ Last Boosted: {last_boosted}
     
     async def get_user_setting(self, user_id: int, setting_name: str) -> any:
         """Get user setting value"""
+        settings = await self.get_user_settings(user_id, (setting_name,))
+        return settings.get(setting_name)
+    
+    async def get_user_settings(self, user_id: int, keys) -> Dict[str, Any]:
+        """Get several user settings with a single DB read"""
+        settings = await self._load_user_settings(user_id)
+        if settings is None:
+            return {}
+        return {key: settings.get(key) for key in keys}
+    
+    async def _load_user_settings(self, user_id: int, ttl: float = 60.0) -> Optional[dict]:
+        """Parsed settings dict for a user, read from the DB at most once per TTL window"""
+        cached = self._settings_cache.get(user_id)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
         user = await self.db.get_user(user_id)
         if not user:
             return None
-        
         settings = Utils.parse_user_settings(user.get("settings", "{}"))
-        setting_value = settings.get(setting_name)
-        return setting_value
+        self._settings_cache[user_id] = (time.monotonic(), settings)
+        return settings
     
-    async def update_user_setting(self, user_id: int, setting_name: str, value: any) -> bool:
-        """Update user setting"""
-        try:
-            user = await self.db.get_user(user_id)
-            if not user:
-                return False
-            
-            settings = Utils.parse_user_settings(user.get("settings", "{}"))
-            settings[setting_name] = value
-            serialized_settings = Utils.serialize_user_settings(settings)
-            
-            # Update in database
-            await self.db._execute_with_lock(
-                "UPDATE users SET settings = ? WHERE id = ?",
-                (serialized_settings, user_id)
+    async def _render(self, callback_query: types.CallbackQuery, text: str, reply_markup=None, parse_mode="Markdown"):
+        """Edit the callback message in place, sending a new one only when editing is impossible"""
+        message = callback_query.message
+        if message:
+            # Skip the round-trip when this message still shows exactly what we last rendered
+            key = (message.chat.id, message.message_id)
+            last = self._last_render.get(key)
+            if (last and last[0] == text and last[1] == parse_mode and last[3] == message.text
+                    and (last[2] is reply_markup or last[2] == reply_markup)):
+                self._last_render.move_to_end(key)
+                return
+            try:
+                edited = await message.edit_text(text, reply_markup=reply_markup, parse_mode=parse_mode)
+                self._last_render[key] = (text, parse_mode, reply_markup, getattr(edited, "text", None))
+                self._last_render.move_to_end(key)
+                if len(self._last_render) > 10_000:
+                    self._last_render.popitem(last=False)
+                return
+            except TelegramBadRequest as e:
+                error_msg = str(e).lower()
+                if "not modified" in error_msg or "exactly the same" in error_msg:
+                    return
+                if "message to edit not found" not in error_msg and "can't be edited" not in error_msg:
+                    raise
+        if self.bot and callback_query.from_user:
+            await self.bot.send_message(
+                callback_query.from_user.id,
+                text,
+                reply_markup=reply_markup,
+                parse_mode=parse_mode
             )
-            await self.db._commit_with_lock()
-            
-            return True
-                
-        except Exception as e:
-            logger.error(f"Error updating user setting: {e}")
-            return False
     
     async def safe_edit_message(self, callback_query: types.CallbackQuery, text: str, reply_markup=None, parse_mode="Markdown"):
         """Safely edit message with proper error handling and fallbacks"""
         try:
-            if callback_query.message and hasattr(callback_query.message, 'edit_text'):
-                await callback_query.message.edit_text(
-                    text,
-                    reply_markup=reply_markup,
-                    parse_mode=parse_mode
-                )
-            else:
-                # Fallback: send new message if edit is not possible
-                if self.bot and callback_query.from_user:
-                    await self.bot.send_message(
-                        callback_query.from_user.id,
-                        text,
-                        reply_markup=reply_markup,
-                        parse_mode=parse_mode
-                    )
+            await self._render(callback_query, text, reply_markup, parse_mode)
         except Exception as e:
-            error_msg = str(e).lower()
-            if any(ignore_phrase in error_msg for ignore_phrase in [
-                "message is not modified", 
-                "message content and reply markup are exactly the same",
-                "message to edit not found"
-            ]):
-                # Silently ignore harmless errors
-                pass
-            else:
-                logger.error(f"Error editing message: {e}")
-                # Try fallback message send
-                try:
-                    if self.bot and callback_query.from_user:
-                        await self.bot.send_message(
-                            callback_query.from_user.id,
-                            text,
-                            reply_markup=reply_markup,
-                            parse_mode=parse_mode
-                        )
-                except Exception as fallback_error:
-                    logger.error(f"Fallback message send also failed: {fallback_error}")
+            logger.error(f"Error editing message: {e}")
     
     # Live Management Methods
     async def show_live_management(self, callback_query: types.CallbackQuery):
         """Show live management menu"""
         try:
-            await callback_query.answer()
+            self._fire(callback_query.answer())
             
             # Try to get monitors with error handling
             try:
@@ -1833,13 +1977,13 @@ Select the number of accounts below:"""
             logger.error(f"Error showing live account selection: {e}")
             await callback_query.answer("❌ Error loading account selection. Please try again.", show_alert=True)
     
-    async def handle_live_account_selection(self, callback_query: types.CallbackQuery, data: str, state: FSMContext):
+    async def handle_live_account_selection(self, callback_query: types.CallbackQuery, arg: str, state: FSMContext):
         """Handle live account count selection"""
         try:
             await callback_query.answer()
             
             # Extract count from callback data
-            count_str = data.split(":")[1]
+            count_str = arg
             
             if count_str == "custom":
                 # Set state for custom input
@@ -1902,7 +2046,7 @@ The setting has been saved successfully!"""
     
     async def show_live_channels(self, callback_query: types.CallbackQuery):
         """Show list of monitored live channels"""
-        await callback_query.answer()
+        self._fire(callback_query.answer())
         
         monitors = await self.db.get_live_monitors(callback_query.from_user.id)
         
@@ -1915,7 +2059,7 @@ You haven't added any channels for live monitoring yet. Click "Add Monitor Chann
 
 💡 **Tip:** The bot will automatically join live streams with all your accounts when detected."""
         else:
-            text = f"📋 **Monitored Live Channels** ({len(monitors)})\n\n"
+            parts = [f"📋 **Monitored Live Channels** ({len(monitors)})\n\n"]
             
             for monitor in monitors:
                 title = monitor.get('title') or 'Unknown Channel'
@@ -1923,10 +2067,13 @@ You haven't added any channels for live monitoring yet. Click "Add Monitor Chann
                 live_count = monitor.get('live_count', 0)
                 last_checked = monitor.get('last_checked', 'Never')
                 
-                text += f"**{title}**\n"
-                text += f"Status: {status}\n"
-                text += f"Lives Joined: {live_count}\n"
-                text += f"Last Check: {last_checked}\n\n"
+                parts.append(
+                    f"**{title}**\n"
+                    f"Status: {status}\n"
+                    f"Lives Joined: {live_count}\n"
+                    f"Last Check: {last_checked}\n\n"
+                )
+            text = "".join(parts)
         
         await self.safe_edit_message(
             callback_query,
@@ -1936,7 +2083,7 @@ You haven't added any channels for live monitoring yet. Click "Add Monitor Chann
     
     async def show_live_monitor_status(self, callback_query: types.CallbackQuery):
         """Show live monitoring system status"""
-        await callback_query.answer()
+        self._fire(callback_query.answer())
         
         monitors = await self.db.get_live_monitors(callback_query.from_user.id)
         all_monitors = await self.db.get_all_active_monitors()
@@ -1970,12 +2117,12 @@ The system checks for live streams every 30 seconds across all monitored channel
             reply_markup=BotKeyboards.live_management()
         )
     
-    async def show_live_channel_info(self, callback_query: types.CallbackQuery, data: str):
+    async def show_live_channel_info(self, callback_query: types.CallbackQuery, arg: str):
         """Show detailed info for a specific monitored channel"""
         await callback_query.answer()
         
         try:
-            monitor_id = int(data.split(":")[1])
+            monitor_id = int(arg)
             monitors = await self.db.get_live_monitors(callback_query.from_user.id)
             
             monitor = next((m for m in monitors if m['id'] == monitor_id), None)
@@ -2021,12 +2168,12 @@ Use the buttons below to manage this channel."""
         except (ValueError, IndexError):
             await callback_query.answer("Invalid channel ID", show_alert=True)
     
-    async def confirm_remove_live_channel(self, callback_query: types.CallbackQuery, data: str):
+    async def confirm_remove_live_channel(self, callback_query: types.CallbackQuery, arg: str):
         """Confirm removal of live monitoring channel"""
         await callback_query.answer()
         
         try:
-            monitor_id = int(data.split(":")[1])
+            monitor_id = int(arg)
             monitors = await self.db.get_live_monitors(callback_query.from_user.id)
             
             monitor = next((m for m in monitors if m['id'] == monitor_id), None)
@@ -2051,7 +2198,7 @@ Use the buttons below to manage this channel."""
     
     async def start_live_monitoring(self, callback_query: types.CallbackQuery):
         """Start live monitoring service"""
-        await callback_query.answer()
+        self._fire(callback_query.answer())
         
         try:
             if self.live_monitor:
@@ -2068,9 +2215,7 @@ Use the buttons below to manage this channel."""
 
 When a live stream is detected, all your accounts will automatically join the stream."""
             else:
-                text = """❌ **Monitoring Service Unavailable**
-
-The live monitoring service is temporarily unavailable. Please try again later."""
+                text = _LIVE_UNAVAILABLE_TEXT
                 
         except Exception as e:
             logger.error(f"Error starting live monitoring: {e}")
@@ -2086,21 +2231,13 @@ There was an error starting the live monitoring service. Please try again."""
     
     async def stop_live_monitoring(self, callback_query: types.CallbackQuery):
         """Stop live monitoring service"""
-        await callback_query.answer()
+        self._fire(callback_query.answer())
         
         try:
             if self.live_monitor:
                 await self.live_monitor.stop_monitoring()
                 
-                text = """⏹️ **Live Monitoring Stopped**
-
-🔴 The live monitoring service has been stopped. No automatic scanning for live streams will occur.
-
-📊 **Status:**
-• Service: Inactive ❌
-• Auto-join: Disabled
-
-You can restart monitoring anytime by clicking "Start Monitoring"."""
+                text = _LIVE_STOPPED_TEXT
             else:
                 text = """❌ **Monitoring Service Unavailable**
 
@@ -2108,9 +2245,7 @@ The live monitoring service is temporarily unavailable."""
                 
         except Exception as e:
             logger.error(f"Error stopping live monitoring: {e}")
-            text = """❌ **Failed to Stop Monitoring**
-
-There was an error stopping the live monitoring service."""
+            text = _LIVE_STOP_FAILED_TEXT
 
         await self.safe_edit_message(
             callback_query,
@@ -2121,64 +2256,18 @@ There was an error stopping the live monitoring service."""
     # Poll Management Functions
     async def show_poll_manager(self, callback_query: types.CallbackQuery):
         """Show poll management menu"""
-        try:
-            text = """
-🗳️ **Poll Manager**
-
-Automatically vote in Telegram polls using your accounts.
-
-**How it works:**
-1. Get the poll URL/link from Telegram
-2. Select which option to vote for
-3. Bot uses all your accounts to vote
-
-**Supported:**
-• Channel polls
-• Group polls 
-• Public polls
-• Private polls (if accounts are members)
-
-Choose an option below:
-            """
-            
-            await callback_query.message.edit_text(
-                text,
-                reply_markup=BotKeyboards.poll_management(),
-                parse_mode="Markdown"
-            )
-            await callback_query.answer()
-            
-        except Exception as e:
-            logger.error(f"Error showing poll manager: {e}")
-            await callback_query.answer("❌ Error loading poll manager", show_alert=True)
+        await asyncio.gather(
+            self.safe_edit_message(callback_query, _POLL_MANAGER_TEXT, BotKeyboards.poll_management(), "HTML"),
+            callback_query.answer()
+        )
     
     async def start_poll_voting(self, callback_query: types.CallbackQuery, state: FSMContext):
         """Start poll voting process"""
-        try:
-            text = """
-🗳️ **Start Poll Voting**
-
-Please send me the poll URL or forward the poll message.
-
-**Supported formats:**
-• `https://t.me/channel/123`
-• `https://t.me/c/123456789/123`
-• Forward the poll message directly
-
-**Note:** Your accounts must have access to the channel/group containing the poll.
-            """
-            
-            await callback_query.message.edit_text(
-                text,
-                reply_markup=BotKeyboards.cancel_operation(),
-                parse_mode="Markdown"
-            )
-            await state.set_state(UserStates.waiting_for_poll_url)
-            await callback_query.answer()
-            
-        except Exception as e:
-            logger.error(f"Error starting poll voting: {e}")
-            await callback_query.answer("❌ Error starting poll voting", show_alert=True)
+        await asyncio.gather(
+            self.safe_edit_message(callback_query, _POLL_START_TEXT, BotKeyboards.cancel_operation(), "HTML"),
+            state.set_state(UserStates.waiting_for_poll_url),
+            callback_query.answer()
+        )
     
     async def process_poll_url(self, message: types.Message, state: FSMContext):
         """Process poll URL and fetch poll data"""
@@ -2231,39 +2320,33 @@ Please send me the poll URL or forward the poll message.
             logger.error(f"Error processing poll URL: {e}")
             await message.answer("❌ Error processing poll URL. Please try again.")
     
-    async def show_poll_options(self, message: types.Message, poll_data: dict, state: FSMContext):
+    async def show_poll_options(self, message: types.Message, poll_data: Dict[str, Any], state: FSMContext):
         """Show poll options for voting"""
+        active_count = len(self.telethon.active_clients)
         try:
             poll_question = poll_data.get('question', 'Poll')
             if len(poll_question) > 100:
                 poll_question = poll_question[:97] + "..."
             
-            options_text = ""
-            for i, option in enumerate(poll_data.get('options', [])):
-                option_text = option.get('text', f'Option {i+1}')
-                voter_count = option.get('voter_count', 0)
-                options_text += f"{i+1}. {option_text} ({voter_count} votes)\n"
+            options = poll_data['options']
+            options_text = "".join(
+                f"{i}. {option['text']} ({option['voter_count']} votes)\n"
+                for i, option in enumerate(options, 1)
+            )
             
-            text = f"""
-🗳️ **Poll Found!**
-
-**Question:** {poll_question}
-
-**Options:**
-{options_text}
-
-**Accounts available:** {len(self.telethon.active_clients)}
-
-Select which option you want to vote for:
-            """
+            text = _POLL_OPTIONS_TEXT.format(question=poll_question, options=options_text, accounts=active_count)
             
             # Store poll data in state
-            await state.update_data(poll_data=poll_data)
-            await state.set_state(UserStates.waiting_for_poll_choice)
+            poll_vote = PollVote(
+                message_url=poll_data['message_url'],
+                message_id=poll_data['message_id'],
+                options=tuple(option['text'] for option in options)
+            )
+            await self._enter_state(state, UserStates.waiting_for_poll_choice, poll_vote=poll_vote)
             
             await message.answer(
                 text,
-                reply_markup=BotKeyboards.poll_options(poll_data),
+                reply_markup=BotKeyboards.poll_option_buttons(poll_vote.options),
                 parse_mode="Markdown"
             )
             
@@ -2271,69 +2354,63 @@ Select which option you want to vote for:
             logger.error(f"Error showing poll options: {e}")
             await message.answer("❌ Error displaying poll options")
     
-    async def execute_poll_vote(self, callback_query: types.CallbackQuery, data: str, state: FSMContext):
+    async def execute_poll_vote(self, callback_query: types.CallbackQuery, arg: str, state: FSMContext):
         """Execute poll voting with all accounts"""
+        active_count = len(self.telethon.active_clients)
         try:
             # Extract option index from callback data
-            option_index = int(data.split(":")[1])
+            option_index = int(arg)
             
             # Get poll data from state
             try:
                 state_data = await state.get_data()
-                poll_data = state_data.get('poll_data', {})
+                poll_vote = state_data.get('poll_vote')
             except Exception as state_error:
                 logger.error(f"Error getting poll data from state: {state_error}")
                 await callback_query.answer("❌ Error retrieving poll data. Please try again.", show_alert=True)
                 return
             
-            if not poll_data:
+            if not poll_vote:
                 await callback_query.answer("❌ Poll data not found. Please start poll voting again.", show_alert=True)
                 return
             
-            selected_option = poll_data['options'][option_index]
-            option_text = selected_option.get('text', f'Option {option_index + 1}')
-            
-            # Show voting progress
-            progress_text = f"""
-🗳️ **Starting Poll Vote**
-
-**Selected option:** {option_text}
-**Available accounts:** {len(self.telethon.active_clients)}
-
-⏳ **Voting in progress...**
-This may take a few moments.
-            """
-            
-            await callback_query.message.edit_text(
-                progress_text,
-                parse_mode="Markdown"
-            )
+            option_text = poll_vote.options[option_index]
             
             # Execute voting with all accounts
-            vote_result = await self.telethon.vote_in_poll(
-                poll_data['message_url'],
-                poll_data['message_id'], 
+            vote_task = asyncio.ensure_future(self.telethon.vote_in_poll(
+                poll_vote.message_url,
+                poll_vote.message_id, 
                 option_index
-            )
+            ))
+            
+            # Only show progress when the vote doesn't finish almost immediately
+            done, _ = await asyncio.wait({vote_task}, timeout=0.5)
+            if not done:
+                await callback_query.message.edit_text(
+                    _POLL_PROGRESS_TEXT.format(option=option_text, accounts=active_count),
+                    parse_mode="Markdown"
+                )
+            
+            vote_result = await vote_task
             
             # Show results
             success_count = vote_result.get('successful_votes', 0)
             total_accounts = vote_result.get('total_accounts', 0)
             failed_accounts = vote_result.get('failed_accounts', [])
             
-            result_text = f"""
-✅ **Poll Voting Complete!**
-
-**Selected option:** {option_text}
-**Successful votes:** {success_count}/{total_accounts}
-"""
-            
+            parts = [
+                "",
+                "✅ **Poll Voting Complete!**",
+                "",
+                f"**Selected option:** {option_text}",
+                f"**Successful votes:** {success_count}/{total_accounts}",
+            ]
             if failed_accounts:
-                result_text += f"**Failed accounts:** {len(failed_accounts)}\n"
+                parts.append(f"**Failed accounts:** {len(failed_accounts)}")
                 if len(failed_accounts) <= 5:
-                    result_text += f"**Failed:** {', '.join(failed_accounts[:5])}\n"
-            
-            result_text += "\n🎉 All available accounts have voted!"
+                    parts.append(f"**Failed:** {', '.join(failed_accounts)}")
+            parts.extend(("", "🎉 All available accounts have voted!"))
+            result_text = "\n".join(parts)
             
             await callback_query.message.edit_text(
                 result_text,
@@ -2351,76 +2428,34 @@ This may take a few moments.
     
     async def show_poll_history(self, callback_query: types.CallbackQuery):
         """Show poll voting history"""
-        try:
-            text = """
-📋 **Poll History**
-
-*This feature will show your recent poll voting activity.*
-
-**Coming Soon:**
-• View recent poll votes
-• Vote statistics  
-• Success/failure rates
-• Account performance
-
-For now, all poll votes are logged in the system logs.
-            """
-            
-            await callback_query.message.edit_text(
-                text,
-                reply_markup=BotKeyboards.back_button("poll_manager"),
-                parse_mode="Markdown"
-            )
-            await callback_query.answer()
-            
-        except Exception as e:
-            logger.error(f"Error showing poll history: {e}")
-            await callback_query.answer("❌ Error loading poll history", show_alert=True)
+        await asyncio.gather(
+            self.safe_edit_message(callback_query, _POLL_HISTORY_TEXT, BotKeyboards.back_button("poll_manager"), "HTML"),
+            callback_query.answer()
+        )
     
     # Helper functions for poll management
     def is_valid_telegram_url(self, url: str) -> bool:
         """Check if URL is a valid Telegram URL"""
-        telegram_patterns = [
-            r'https://t\.me/\w+/\d+',
-            r'https://t\.me/c/\d+/\d+',
-            r'https://telegram\.me/\w+/\d+'
-        ]
-        
-        import re
-        for pattern in telegram_patterns:
-            if re.match(pattern, url):
-                return True
-        return False
+        if len(url) > _TG_URL_MAX_LEN or not url.startswith(_TG_PREFIXES):
+            return False
+        return _TG_URL_RE.fullmatch(url) is not None
     
-    async def extract_poll_data_from_message(self, message: types.Message) -> dict:
+    async def extract_poll_data_from_message(self, message: types.Message) -> Optional[Dict[str, Any]]:
         """Extract poll data from a message"""
-        try:
-            if not message.poll:
-                return None
-            
-            poll = message.poll
-            poll_data = {
-                'question': poll.question,
-                'options': [],
-                'message_id': message.message_id,
-                'message_url': f"https://t.me/c/{message.chat.id}/{message.message_id}",
-                'is_anonymous': poll.is_anonymous,
-                'allows_multiple_answers': poll.allows_multiple_answers
-            }
-            
-            for option in poll.options:
-                poll_data['options'].append({
-                    'text': option.text,
-                    'voter_count': option.voter_count
-                })
-            
-            return poll_data
-            
-        except Exception as e:
-            logger.error(f"Error extracting poll data from message: {e}")
+        poll = message.poll
+        if not poll:
             return None
+        
+        return {
+            'question': poll.question,
+            'options': [{'text': o.text, 'voter_count': o.voter_count} for o in poll.options],
+            'message_id': message.message_id,
+            'message_url': f"https://t.me/c/{message.chat.id}/{message.message_id}",
+            'is_anonymous': poll.is_anonymous,
+            'allows_multiple_answers': poll.allows_multiple_answers
+        }
     
-    async def fetch_poll_from_url(self, url: str) -> dict:
+    async def fetch_poll_from_url(self, url: str) -> Optional[Dict[str, Any]]:
         """Fetch poll data from Telegram URL"""
         try:
             # Use Telethon to fetch the message and extract poll
@@ -2466,15 +2501,9 @@ For now, all poll votes are logged in the system logs.
             # Store view count and proceed to time selection
             await state.update_data(selected_view_count=view_count)
             
-            text = f"""
-⏰ **Select Time Frame**
-
-📊 Views Selected: {view_count:,}
-📢 Channel: {state_data.get("boost_channel_link", "Unknown")}
-
-🕒 **Choose time frame for the views:**
-Select how quickly you want the views to be delivered.
-            """
+            text = _TIME_FRAME_TEXT.format(
+                view_count=view_count, channel_link=state_data.get("boost_channel_link", "Unknown")
+            )
             
             await message.answer(
                 text,
@@ -2575,7 +2604,8 @@ Select how quickly you want the views to be delivered.
                 channel_id = state_data.get("boost_channel_id")
                 if channel_id:
                     await self.db.update_channel_boost(channel_id, boost_count)
-                    await self.db.log_action(
+                    self._invalidate_channels(user_id)
+                    self.db.enqueue_log(
                         LogType.BOOST,
                         user_id=user_id,
                         channel_id=channel_id,
@@ -2736,7 +2766,7 @@ Select how quickly you want the views to be delivered.
                 # Update database
                 channel_id = state_data.get("reaction_channel_id")
                 if channel_id:
-                    await self.db.log_action(
+                    self.db.enqueue_log(
                         LogType.BOOST,  # Using BOOST log type for reactions
                         user_id=user_id,
                         channel_id=channel_id,
@@ -2841,16 +2871,14 @@ Select how quickly you want the views to be delivered.
     async def set_user_setting(self, user_id: int, setting_name: str, value: Any) -> bool:
         """Set a specific user setting"""
         try:
-            # Get current settings
-            user = await self.db.get_user(user_id)
-            if not user:
+            # Single in-place UPDATE of the one key, then write through to a cached copy
+            if not await self.db.update_user_setting(user_id, setting_name, value):
+                self._settings_cache.pop(user_id, None)
                 return False
-            
-            settings = Utils.parse_user_settings(user.get("settings", "{}"))
-            settings[setting_name] = value
-            
-            # Update settings in database
-            return await self.db.update_user_settings(user_id, settings)
+            cached = self._settings_cache.get(user_id)
+            if cached:
+                self._settings_cache[user_id] = (cached[0], {**cached[1], setting_name: value})
+            return True
         except Exception as e:
             logger.error(f"Error setting user setting {setting_name}: {e}")
             return False
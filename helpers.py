@@ -5,11 +5,47 @@ import re
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Settings blobs are parsed far more often than written; use orjson's faster parser when installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Parsed timestamps are reused across renders; the relative text is not cached
+# because it depends on the current time.
+_parse_timestamp = lru_cache(maxsize=4096)(datetime.fromisoformat)
+
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# One token per match: a t.me message link, or a standalone ID / ID range
+_MESSAGE_TOKEN_RE = re.compile(
+    r't\.me/(?:c/\d+|[^/\s,]+)/(\d+)'
+    r'|(?<![^\s,])(\d+)(?:-(\d+))?(?![^\s,])'
+)
+
+# Public/invite URLs keep their path; bare or @-prefixed usernames are rebuilt
+_LINK_RE = re.compile(
+    r'^(?:https://t\.me/(?P<path>[a-zA-Z0-9_]{5,}|joinchat/[a-zA-Z0-9_-]+|\+[a-zA-Z0-9_-]+)'
+    r'|@?(?P<username>[a-zA-Z0-9_]{5,}))$'
+)
+
+# Seconds between boost actions for each delay level
+DELAY_RANGES = {
+    "low": (1, 2),
+    "medium": (2, 5),
+    "high": (5, 10),
+}
+
+def truncate(text: str, max_length: int = 40) -> str:
+    """Truncate text to max_length characters using a single-character ellipsis"""
+    return text if len(text) <= max_length else text[:max_length - 1] + "…"
+
 class Utils:
     """Utility functions"""
     
@@ -17,7 +53,7 @@ class Utils:
     def is_valid_phone(phone: str) -> bool:
         """Validate phone number format"""
         # Remove all non-digits
-        digits_only = re.sub(r'\D', '', phone)
+        digits_only = _NON_DIGIT_RE.sub('', phone)
         
         # Check if it's a valid length (7-15 digits)
         return 7 <= len(digits_only) <= 15
@@ -25,23 +61,20 @@ class Utils:
     @staticmethod
     def format_phone(phone: str) -> str:
         """Format phone number with + prefix"""
-        digits_only = re.sub(r'\D', '', phone)
-        if not digits_only.startswith('1') and len(digits_only) >= 10:
-            return f"+{digits_only}"
-        return f"+{digits_only}"
+        return f"+{_NON_DIGIT_RE.sub('', phone)}"
     
     @staticmethod
     def is_valid_telegram_link(link: str) -> bool:
         """Validate Telegram channel/group link"""
-        patterns = [
-            r'^https://t\.me/[a-zA-Z0-9_]{5,}$',  # Public channels
-            r'^https://t\.me/joinchat/[a-zA-Z0-9_-]+$',  # Old private invite links
-            r'^https://t\.me/\+[a-zA-Z0-9_-]+$',  # New private invite links with +
-            r'^@[a-zA-Z0-9_]{5,}$',  # Username format
-            r'^[a-zA-Z0-9_]{5,}$',  # Just username without @
-        ]
-        
-        return any(re.match(pattern, link.strip()) for pattern in patterns)
+        return _LINK_RE.match(link.strip()) is not None
+    
+    @staticmethod
+    def parse_telegram_link(link: str) -> Optional[str]:
+        """Validate and normalize a Telegram link in one pass, None if invalid"""
+        match = _LINK_RE.match(link.strip())
+        if not match:
+            return None
+        return f"https://t.me/{match.group('path') or match.group('username')}"
     
     @staticmethod
     def normalize_telegram_link(link: str) -> str:
@@ -70,13 +103,11 @@ class Utils:
             if not link:
                 return False, "", "Channel link cannot be empty"
             
-            # Check if valid format
-            if not Utils.is_valid_telegram_link(link):
+            # Check format and normalize the link
+            normalized_link = Utils.parse_telegram_link(link)
+            if not normalized_link:
                 return False, "", "Invalid channel link format. Use @username or https://t.me/username"
             
-            # Normalize the link
-            normalized_link = Utils.normalize_telegram_link(link)
-            
             return True, normalized_link, ""
             
         except Exception as e:
@@ -95,7 +126,7 @@ class Utils:
                     "auto_message_count": 10,  # Default: boost last 10 messages
                     "live_account_count": None  # Default: use all accounts for live streams
                 }
-            settings = json.loads(settings_json)
+            settings = _json_loads(settings_json)
             # Force account rotation to always be True
             settings["account_rotation"] = True
             return settings
@@ -126,7 +157,7 @@ class Utils:
             return "Never"
         
         try:
-            dt = datetime.fromisoformat(dt_str)
+            dt = _parse_timestamp(dt_str)
             now = datetime.now()
             diff = now - dt
             
@@ -160,12 +191,7 @@ class Utils:
     @staticmethod
     def get_delay_range(delay_level: str) -> tuple:
         """Get delay range based on level"""
-        delay_ranges = {
-            "low": (1, 2),
-            "medium": (2, 5),
-            "high": (5, 10)
-        }
-        return delay_ranges.get(delay_level, (2, 5))
+        return DELAY_RANGES.get(delay_level, DELAY_RANGES["medium"])
     
     @staticmethod
     def truncate_text(text: str, max_length: int = 50) -> str:
@@ -175,27 +201,30 @@ class Utils:
         return text[:max_length-3] + "..."
     
     @staticmethod
-    def extract_message_ids_and_links(text: str) -> List[int]:
+    def extract_message_ids_and_links(text: str, max_ids: Optional[int] = None) -> List[int]:
         """Extract message IDs from text input (supports both IDs and message links)"""
         try:
-            # Split by comma, space, or newline
-            parts = re.split(r'[,\s\n]+', text.strip())
-            message_ids = []
+            # Dict keys keep first-seen order while removing duplicates
+            message_ids: Dict[int, None] = {}
             
-            for part in parts:
-                if part.isdigit():
-                    message_ids.append(int(part))
-                elif '-' in part and all(p.isdigit() for p in part.split('-')):
-                    # Handle ranges like "1-5"
-                    start, end = map(int, part.split('-'))
-                    message_ids.extend(range(start, end + 1))
-                elif 't.me/' in part:
-                    # Handle message links like https://t.me/channel/123
-                    message_id = Utils.extract_message_id_from_link(part)
-                    if message_id:
-                        message_ids.append(message_id)
+            for match in _MESSAGE_TOKEN_RE.finditer(text):
+                link_id, start, end = match.groups()
+                if link_id:
+                    # Message links like https://t.me/channel/123
+                    message_ids[int(link_id)] = None
+                elif end is None:
+                    message_ids[int(start)] = None
+                else:
+                    # Ranges like "1-5"; never expand past the cap
+                    start, end = int(start), int(end)
+                    if max_ids is not None:
+                        end = min(end, start + max_ids)
+                    message_ids.update(dict.fromkeys(range(start, end + 1)))
+                
+                if max_ids is not None and len(message_ids) > max_ids:
+                    break
             
-            return list(set(message_ids))  # Remove duplicates
+            return list(message_ids)
         except Exception as e:
             logger.error(f"Error extracting message IDs from '{text}': {e}")
             return []
@@ -302,7 +331,7 @@ class Utils:
         if not text.strip():
             return False, [], "Please enter message IDs or message links"
         
-        message_ids = Utils.extract_message_ids_and_links(text)
+        message_ids = Utils.extract_message_ids_and_links(text, max_ids=100)
         
         if not message_ids:
             return False, [], "No valid message IDs found. Use numbers, ranges (1-5), or message links (https://t.me/channel/123)."
@@ -2,13 +2,22 @@
 Inline keyboard definitions for the Telegram bot
 Creates beautiful and modern UI elements
 """
+from functools import lru_cache
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+_ACCOUNT_STATUS_EMOJI = {
+    "active": "✅",
+    "banned": "🚫",
+    "floodwait": "⏳",
+    "inactive": "❌"
+}
 
 class BotKeyboards:
     """Static class for keyboard generation"""
     
     @staticmethod
+    @lru_cache(maxsize=2)
     def main_menu(is_admin: bool = False) -> InlineKeyboardMarkup:
         """Main menu keyboard - Personal use only"""
         # Always return personal interface since it's personal use
@@ -39,6 +48,7 @@ class BotKeyboards:
         return InlineKeyboardMarkup(inline_keyboard=buttons)
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def channel_control() -> InlineKeyboardMarkup:
         """Channel control keyboard"""
         buttons = [
@@ -92,6 +102,7 @@ class BotKeyboards:
         return InlineKeyboardMarkup(inline_keyboard=buttons)
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def settings_menu() -> InlineKeyboardMarkup:
         """Settings configuration menu"""
         buttons = [
@@ -102,6 +113,7 @@ class BotKeyboards:
         return InlineKeyboardMarkup(inline_keyboard=buttons)
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def delay_settings() -> InlineKeyboardMarkup:
         """Delay configuration options"""
         buttons = [
@@ -113,6 +125,7 @@ class BotKeyboards:
         return InlineKeyboardMarkup(inline_keyboard=buttons)
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def auto_count_settings() -> InlineKeyboardMarkup:
         """Auto message count configuration options"""
         buttons = [
@@ -139,32 +152,32 @@ class BotKeyboards:
     @staticmethod
     def account_list_admin(accounts: List[Dict[str, Any]]) -> InlineKeyboardMarkup:
         """Admin account list with status indicators"""
+        return BotKeyboards.account_list_admin_rows([
+            (account["id"], account["status"], account.get("username"), account.get("phone", "Unknown"))
+            for account in accounts[:10]
+        ])
+    
+    @staticmethod
+    def account_list_admin_rows(rows: List[Tuple[int, str, Optional[str], str]]) -> InlineKeyboardMarkup:
+        """Admin account list from slim (id, status, username, phone) rows"""
         buttons = []
         
-        for account in accounts[:10]:  # Limit to 10 accounts per page
-            status_emoji = {
-                "active": "✅",
-                "banned": "🚫",
-                "floodwait": "⏳",
-                "inactive": "❌"
-            }
-            
-            emoji = status_emoji.get(account["status"], "❓")
+        for account_id, status, username, phone in rows[:10]:  # Limit to 10 accounts per page
+            emoji = _ACCOUNT_STATUS_EMOJI.get(status, "❓")
             
-            username = account.get("username")
             if username:
                 display_name = f"@{username}" if not username.startswith('@') else username
             else:
-                display_name = account.get("phone", "Unknown")
+                display_name = phone
             
             buttons.append([
                 InlineKeyboardButton(
                     text=f"{emoji} {display_name}",
-                    callback_data=f"account_details:{account['id']}"
+                    callback_data=f"account_details:{account_id}"
                 )
             ])
         
-        if not accounts:
+        if not rows:
             buttons.append([
                 InlineKeyboardButton(text="➕ Add First Account", callback_data="add_account")
             ])
@@ -177,6 +190,7 @@ class BotKeyboards:
         return InlineKeyboardMarkup(inline_keyboard=buttons)
     
     @staticmethod
+    @lru_cache(maxsize=64)
     def back_button(callback_data: str) -> InlineKeyboardMarkup:
         """Simple back button"""
         return InlineKeyboardMarkup(inline_keyboard=[
@@ -184,6 +198,7 @@ class BotKeyboards:
         ])
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def cancel_operation() -> InlineKeyboardMarkup:
         """Cancel current operation"""
         return InlineKeyboardMarkup(inline_keyboard=[
@@ -205,6 +220,7 @@ class BotKeyboards:
         return InlineKeyboardMarkup(inline_keyboard=buttons)
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def live_management() -> InlineKeyboardMarkup:
         """Live Management keyboard"""
         buttons = [
@@ -306,6 +322,7 @@ class BotKeyboards:
         return InlineKeyboardMarkup(inline_keyboard=buttons)
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def poll_management() -> InlineKeyboardMarkup:
         """Poll Management keyboard"""
         buttons = [
@@ -318,20 +335,24 @@ class BotKeyboards:
     @staticmethod
     def poll_options(poll_data: dict) -> InlineKeyboardMarkup:
         """Generate keyboard for poll options"""
+        return BotKeyboards.poll_option_buttons(tuple(option['text'] for option in poll_data['options']))
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def poll_option_buttons(options: Tuple[str, ...]) -> InlineKeyboardMarkup:
+        """Poll option keyboard, shared by every poll with the same option texts"""
         buttons = []
         
-        if 'options' in poll_data:
-            for i, option in enumerate(poll_data['options']):
-                option_text = option.get('text', f'Option {i+1}')
-                if len(option_text) > 30:
-                    option_text = option_text[:27] + "..."
-                
-                buttons.append([
-                    InlineKeyboardButton(
-                        text=f"🗳️ {option_text}",
-                        callback_data=f"vote_option:{i}"
-                    )
-                ])
+        for i, option_text in enumerate(options):
+            if len(option_text) > 30:
+                option_text = option_text[:27] + "..."
+            
+            buttons.append([
+                InlineKeyboardButton(
+                    text=f"🗳️ {option_text}",
+                    callback_data=f"vote_option:{i}"
+                )
+            ])
         
         buttons.append([
             InlineKeyboardButton(text="🔙 Back", callback_data="poll_manager"),
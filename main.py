@@ -75,5 +75,12 @@ async def main():
         logger.info("Bot shutdown complete")
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed (not available on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run the bot
     asyncio.run(main())
@@ -34,6 +34,34 @@ class RateLimiter:
         self.MIN_DELAY = 1.0
         self.MAX_DELAY = 3.0
         self.FLOOD_WAIT_BUFFER = 5  # Extra seconds to wait after flood wait
+        
+        # Shared token bucket for fan-out operations (requests per second)
+        self.TOKENS_PER_SECOND = 30.0
+        self._tokens = self.TOKENS_PER_SECOND
+        self._tokens_ts = time.monotonic()
+        self._bucket_lock = asyncio.Lock()
+        self.pause_until = 0.0  # monotonic time before which no token is handed out
+    
+    async def acquire(self):
+        """Take one token from the shared bucket, waiting out refills and global pauses"""
+        async with self._bucket_lock:
+            while True:
+                now = time.monotonic()
+                if now < self.pause_until:
+                    await asyncio.sleep(self.pause_until - now)
+                    continue
+                self._tokens = min(self.TOKENS_PER_SECOND,
+                                   self._tokens + (now - self._tokens_ts) * self.TOKENS_PER_SECOND)
+                self._tokens_ts = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.TOKENS_PER_SECOND)
+    
+    def pause(self, seconds: float):
+        """Hold every acquire() until a flood wait has elapsed"""
+        self.pause_until = max(self.pause_until, time.monotonic() + seconds + self.FLOOD_WAIT_BUFFER)
+        logger.warning(f"Shared rate limiter paused for {seconds}s after flood wait")
     
     async def wait_for_account(self, account_id: str) -> bool:
         """Wait for account to be available for API calls"""
@@ -6,8 +6,9 @@ import asyncio
 import logging
 import os
 import random
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from telethon import TelegramClient, events
@@ -16,10 +17,10 @@ from telethon.errors import (
     PhoneNumberInvalidError, ChannelPrivateError, ChatAdminRequiredError,
     UserBannedInChannelError, UserAlreadyParticipantError, PeerFloodError
 )
-from telethon.tl.functions.messages import GetMessagesViewsRequest, SendReactionRequest
+from telethon.tl.functions.messages import GetMessagesViewsRequest, SendReactionRequest, SendVoteRequest
 from telethon.tl.functions.channels import JoinChannelRequest
 from telethon.tl.functions.phone import JoinGroupCallRequest
-from telethon.tl.types import InputPeerChannel, InputPeerChat, InputPeerUser, ReactionEmoji
+from telethon.tl.types import InputPeerChannel, InputPeerChat, InputPeerUser, MessageMediaPoll, ReactionEmoji
 
 from database import DatabaseManager, AccountStatus, LogType
 from config import Config
@@ -43,6 +44,13 @@ class TelethonManager:
         
         # Track live stream management state
         self.active_group_calls: Dict[str, Dict] = {}  # Track active calls per session
+        
+        # Coalesce concurrent recent-message lookups and keep results briefly
+        self._messages_inflight: Dict[Tuple[str, int], asyncio.Future] = {}
+        self._messages_cache: Dict[Tuple[str, int], Tuple[float, List[int]]] = {}
+        
+        # Bounds per-account poll votes across every poll being voted at once
+        self._vote_semaphore = asyncio.Semaphore(max(1, config.MAX_CONCURRENT_ACCOUNTS))
     
     
     async def start_account_verification(self, phone: str, api_id: Optional[int] = None, api_hash: Optional[str] = None) -> Tuple[bool, str, Optional[dict]]:
@@ -383,7 +391,8 @@ class TelethonManager:
         return False, f"❌ Failed to join channel ({failed_accounts} accounts failed)", None
     
     async def boost_views(self, channel_link: str, message_ids: List[int], 
-                         mark_as_read: bool = True) -> Tuple[bool, str, int]:
+                         mark_as_read: bool = True,
+                         progress_callback: Optional[Callable[[int, int], Awaitable[None]]] = None) -> Tuple[bool, str, int]:
         """
         Boost views for specific messages using ALL available accounts
         Returns (success, message, boost_count)
@@ -391,96 +400,109 @@ class TelethonManager:
         if not self.active_clients:
             return False, "❌ No active accounts available", 0
         
-        total_boosts = 0
-        successful_accounts = 0
-        used_accounts = []
+        # Fetch accounts once and pair them with their live clients
+        accounts = await self.db.get_active_accounts()
+        accounts_by_session = {acc["session_name"]: acc for acc in accounts}
+        targets = [
+            (self.clients[session_name], accounts_by_session[session_name])
+            for session_name in dict.fromkeys(self.active_clients)
+            if session_name in self.clients and session_name in accounts_by_session
+        ]
         
-        # Use ALL available accounts for maximum boost effect
-        available_sessions = self.active_clients.copy()  # Copy list of session names
+        semaphore = asyncio.Semaphore(max(1, self.config.MAX_CONCURRENT_ACCOUNTS))
+        completed = 0
         
-        # Iterate through all available accounts
-        for session_name in available_sessions:
-            if session_name in used_accounts:
-                continue
-                
-            # Get the specific client for this session
-            if session_name not in self.clients:
-                continue
-                
-            client = self.clients[session_name]
-            
-            # Get account info from database
-            accounts = await self.db.get_active_accounts()
-            account = next((acc for acc in accounts if acc["session_name"] == session_name), None)
-            if not account:
-                continue
-                
-            used_accounts.append(session_name)
-            
+        async def _boost_one(client, account) -> int:
+            nonlocal completed
             try:
-                # Get channel entity
-                entity = await client.get_entity(channel_link)
-                
-                # Boost views with better error handling
-                try:
-                    result = await client(GetMessagesViewsRequest(
-                        peer=entity,
-                        id=message_ids,
-                        increment=True
-                    ))
-                except Exception as boost_error:
-                    logger.warning(f"Boost request failed: {boost_error}")
-                    continue
-                
-                if mark_as_read:
-                    # Mark messages as read using proper method
+                async with semaphore:
+                    return await self._boost_with_account(
+                        client, account, channel_link, message_ids, mark_as_read
+                    )
+            finally:
+                completed += 1
+                if progress_callback:
                     try:
-                        if hasattr(entity, 'id'):
-                            await client.send_read_acknowledge(entity.id, max_id=max(message_ids))
-                    except Exception as read_error:
-                        logger.warning(f"Could not mark messages as read: {read_error}")
-                
-                # Count successful views - assume success if we got here
-                boost_count = len(message_ids)  # Each message ID gets one view boost
-                total_boosts += boost_count
-                successful_accounts += 1
-                
-                await self.db.log_action(
-                    LogType.BOOST,
-                    account_id=account["id"],
-                    message=f"Boosted {boost_count} messages with {account.get('username', account['phone'])}"
-                )
-                
-                # Add random delay between accounts
-                await asyncio.sleep(random.uniform(
-                    self.config.DEFAULT_DELAY_MIN, 
-                    self.config.DEFAULT_DELAY_MAX
-                ))
-                
-            except FloodWaitError as e:
-                # Handle flood wait
-                flood_wait_until = datetime.now() + timedelta(seconds=e.seconds)
-                await self.db.update_account_status(account["id"], AccountStatus.FLOOD_WAIT, flood_wait_until)
-                await self.db.log_action(
-                    LogType.FLOOD_WAIT,
-                    account_id=account["id"],
-                    message=f"Flood wait during boost: {e.seconds}s"
-                )
-                
-            except Exception as e:
-                logger.error(f"Error boosting with {account.get('username', account['phone'])}: {e}")
-                await self.db.increment_failed_attempts(account["id"])
-                await self.db.log_action(
-                    LogType.ERROR,
-                    account_id=account["id"],
-                    message=f"Boost error: {str(e)}"
-                )
+                        await progress_callback(completed, len(targets))
+                    except Exception as e:
+                        logger.warning(f"Boost progress callback failed: {e}")
+        
+        results = await asyncio.gather(
+            *(_boost_one(client, account) for client, account in targets),
+            return_exceptions=True
+        )
+        boost_counts = [result for result in results if isinstance(result, int)]
+        total_boosts = sum(boost_counts)
+        successful_accounts = sum(1 for count in boost_counts if count > 0)
         
         if total_boosts > 0:
             total_accounts = len(self.active_clients)
             return True, f"✅ Boosted {len(message_ids)} messages with {successful_accounts}/{total_accounts} accounts", total_boosts
         else:
             return False, "❌ No views were boosted", 0
+    
+    async def _boost_with_account(self, client, account: Dict[str, Any], channel_link: str,
+                                  message_ids: List[int], mark_as_read: bool) -> int:
+        """Boost views with a single account, returns the number of views added"""
+        try:
+            # Get channel entity
+            entity = await client.get_entity(channel_link)
+            
+            # Boost views with better error handling
+            try:
+                await client(GetMessagesViewsRequest(
+                    peer=entity,
+                    id=message_ids,
+                    increment=True
+                ))
+            except Exception as boost_error:
+                logger.warning(f"Boost request failed: {boost_error}")
+                return 0
+            
+            if mark_as_read:
+                # Mark messages as read using proper method
+                try:
+                    if hasattr(entity, 'id'):
+                        await client.send_read_acknowledge(entity.id, max_id=max(message_ids))
+                except Exception as read_error:
+                    logger.warning(f"Could not mark messages as read: {read_error}")
+            
+            # Count successful views - assume success if we got here
+            boost_count = len(message_ids)  # Each message ID gets one view boost
+            
+            # Log rows go to the background writer so boosting never waits on a commit
+            self.db.enqueue_log(
+                LogType.BOOST,
+                account_id=account["id"],
+                message=f"Boosted {boost_count} messages with {account.get('username', account['phone'])}"
+            )
+            
+            # Random delay keeps this concurrency slot busy so accounts stay spread out
+            await asyncio.sleep(random.uniform(
+                self.config.DEFAULT_DELAY_MIN, 
+                self.config.DEFAULT_DELAY_MAX
+            ))
+            return boost_count
+            
+        except FloodWaitError as e:
+            # Handle flood wait
+            flood_wait_until = datetime.now() + timedelta(seconds=e.seconds)
+            await self.db.update_account_status(account["id"], AccountStatus.FLOOD_WAIT, flood_wait_until)
+            self.db.enqueue_log(
+                LogType.FLOOD_WAIT,
+                account_id=account["id"],
+                message=f"Flood wait during boost: {e.seconds}s"
+            )
+            
+        except Exception as e:
+            logger.error(f"Error boosting with {account.get('username', account['phone'])}: {e}")
+            await self.db.increment_failed_attempts(account["id"])
+            self.db.enqueue_log(
+                LogType.ERROR,
+                account_id=account["id"],
+                message=f"Boost error: {str(e)}"
+            )
+        return 0
 
     async def react_to_messages(self, channel_link: str, message_ids: List[int]) -> Tuple[bool, str, int]:
         """
@@ -503,6 +525,7 @@ class TelethonManager:
         
         # Process one account per message ID for rotation
         available_sessions = self.active_clients.copy()
+        accounts_by_session = {acc["session_name"]: acc for acc in await self.db.get_active_accounts()}
         
         for i, message_id in enumerate(message_ids):
             # Cycle through accounts
@@ -520,9 +543,7 @@ class TelethonManager:
                 
             client = self.clients[session_name]
             
-            # Get account info from database
-            accounts = await self.db.get_active_accounts()
-            account = next((acc for acc in accounts if acc["session_name"] == session_name), None)
+            account = accounts_by_session.get(session_name)
             if not account:
                 continue
                 
@@ -543,9 +564,9 @@ class TelethonManager:
                 total_reactions += 1
                 successful_accounts += 1
                 
-                # Log success
-                await self.db.log_action(
-                    LogType.BOOST,  # Using BOOST log type for reactions
+                # Log success (BOOST log type for reactions); the queued log writer group-commits it
+                self.db.enqueue_log(
+                    LogType.BOOST,
                     account_id=account["id"],
                     message=f"Reacted {random_emoji} to message {message_id} with {account.get('username', account['phone'])}"
                 )
@@ -559,7 +580,7 @@ class TelethonManager:
                 # Set flood wait status
                 flood_wait_until = datetime.now() + timedelta(seconds=e.seconds)
                 await self.db.update_account_status(account["id"], AccountStatus.FLOOD_WAIT, flood_wait_until)
-                await self.db.log_action(
+                self.db.enqueue_log(
                     LogType.FLOOD_WAIT,
                     account_id=account["id"],
                     message=f"Flood wait during reaction: {e.seconds}s for {account.get('username', account['phone'])}"
@@ -569,7 +590,7 @@ class TelethonManager:
             except UserBannedInChannelError:
                 # Mark account as banned
                 await self.db.update_account_status(account["id"], AccountStatus.BANNED)
-                await self.db.log_action(
+                self.db.enqueue_log(
                     LogType.BAN,
                     account_id=account["id"],
                     message=f"Account {account.get('username', account['phone'])} banned during reaction"
@@ -595,7 +616,7 @@ class TelethonManager:
                 else:
                     logger.error(f"Error reacting to message {message_id} with {account.get('username', account['phone'])}: {e}")
                 await self.db.increment_failed_attempts(account["id"])
-                await self.db.log_action(
+                self.db.enqueue_log(
                     LogType.ERROR,
                     account_id=account["id"],
                     message=f"Reaction error: {str(e)}"
@@ -609,8 +630,36 @@ class TelethonManager:
             
         return total_reactions > 0, result_message, total_reactions
     
-    async def get_channel_messages(self, channel_link: str, limit: int = 10) -> List[int]:
-        """Get recent message IDs from a channel"""
+    async def get_channel_messages(self, channel_link: str, limit: int = 10, ttl: float = 5.0) -> List[int]:
+        """Get recent message IDs from a channel, sharing in-flight and recent fetches"""
+        key = (channel_link, limit)
+        cached = self._messages_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return list(cached[1])
+        
+        future = self._messages_inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._messages_inflight[key] = future
+            try:
+                message_ids = await self._fetch_channel_messages(channel_link, limit)
+                if message_ids:
+                    self._messages_cache[key] = (time.monotonic(), message_ids)
+                future.set_result(message_ids)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                raise
+            finally:
+                self._messages_inflight.pop(key, None)
+            return list(message_ids)
+        
+        return list(await asyncio.shield(future))
+    
+    async def _fetch_channel_messages(self, channel_link: str, limit: int) -> List[int]:
+        """Fetch recent message IDs from a channel"""
         client_data = await self.get_next_available_client()
         if not client_data:
             logger.warning("No available clients for channel message fetching")
@@ -1674,66 +1723,20 @@ class TelethonManager:
             if not channel_id:
                 return {"success": False, "message": "Invalid message URL", "successful_votes": 0, "total_accounts": 0}
             
-            successful_votes = 0
-            failed_accounts = []
-            total_accounts = len(self.active_clients)
+            sessions = list(self.active_clients)
+            total_accounts = len(sessions)
             
             logger.info(f"Starting poll voting with {total_accounts} accounts for option {option_index}")
             
-            for session_name in self.active_clients:
-                try:
-                    client = self.clients[session_name]
-                    
-                    # Get the entity
-                    entity = await client.get_entity(channel_id)
-                    
-                    # Get the message to verify it contains a poll
-                    message = await client.get_messages(entity, ids=message_id)
-                    if not message or not hasattr(message, 'media'):
-                        logger.error(f"Message {message_id} not found or has no media")
-                        failed_accounts.append(session_name)
-                        continue
-                    
-                    from telethon.tl.types import MessageMediaPoll
-                    if not isinstance(message.media, MessageMediaPoll):
-                        logger.error(f"Message {message_id} does not contain a poll")
-                        failed_accounts.append(session_name)
-                        continue
-                    
-                    poll = message.media.poll
-                    
-                    # Check if poll is closed
-                    if poll.closed:
-                        logger.warning(f"Poll is closed, cannot vote")
-                        failed_accounts.append(session_name)
-                        continue
-                    
-                    # Validate option index
-                    if option_index >= len(poll.answers):
-                        logger.error(f"Invalid option index {option_index}, poll has {len(poll.answers)} options")
-                        failed_accounts.append(session_name)
-                        continue
-                    
-                    # Get the option bytes
-                    selected_option = poll.answers[option_index].option
-                    
-                    # Vote in the poll
-                    from telethon.tl.functions.messages import SendVoteRequest
-                    await client(SendVoteRequest(
-                        peer=entity,
-                        msg_id=message_id,
-                        options=[selected_option]
-                    ))
-                    
-                    successful_votes += 1
-                    logger.info(f"✅ Account {session_name} voted successfully in poll")
-                    
-                    # Add small delay between votes
-                    await asyncio.sleep(1)
-                    
-                except Exception as vote_error:
-                    logger.error(f"Failed to vote with account {session_name}: {vote_error}")
-                    failed_accounts.append(session_name)
+            results = await asyncio.gather(
+                *(self._vote_with_account(session_name, channel_id, message_id, option_index)
+                  for session_name in sessions),
+                return_exceptions=True
+            )
+            successful_votes = sum(1 for voted in results if voted is True)
+            failed_accounts = [
+                session_name for session_name, voted in zip(sessions, results) if voted is not True
+            ]
             
             success = successful_votes > 0
             message = f"Poll voting completed: {successful_votes}/{total_accounts} accounts voted successfully"
@@ -1764,6 +1767,57 @@ class TelethonManager:
                 "failed_accounts": list(self.active_clients) if self.active_clients else []
             }
     
+    async def _vote_with_account(self, session_name: str, channel_id, message_id: int, option_index: int) -> bool:
+        """Cast one account's vote through the shared semaphore and token bucket"""
+        async with self._vote_semaphore:
+            await rate_limiter.acquire()
+            try:
+                client = self.clients[session_name]
+                
+                # Get the entity
+                entity = await client.get_entity(channel_id)
+                
+                # Get the message to verify it contains a poll
+                message = await client.get_messages(entity, ids=message_id)
+                if not message or not hasattr(message, 'media'):
+                    logger.error(f"Message {message_id} not found or has no media")
+                    return False
+                
+                if not isinstance(message.media, MessageMediaPoll):
+                    logger.error(f"Message {message_id} does not contain a poll")
+                    return False
+                
+                poll = message.media.poll
+                
+                # Check if poll is closed
+                if poll.closed:
+                    logger.warning(f"Poll is closed, cannot vote")
+                    return False
+                
+                # Validate option index
+                if option_index >= len(poll.answers):
+                    logger.error(f"Invalid option index {option_index}, poll has {len(poll.answers)} options")
+                    return False
+                
+                # Vote in the poll
+                await client(SendVoteRequest(
+                    peer=entity,
+                    msg_id=message_id,
+                    options=[poll.answers[option_index].option]
+                ))
+                
+                logger.info(f"✅ Account {session_name} voted successfully in poll")
+                return True
+                
+            except FloodWaitError as e:
+                # Stop every pending vote from burning requests until the wait is over
+                rate_limiter.pause(e.seconds)
+                logger.error(f"Failed to vote with account {session_name}: flood wait {e.seconds}s")
+                return False
+            except Exception as vote_error:
+                logger.error(f"Failed to vote with account {session_name}: {vote_error}")
+                return False
+    
     def extract_channel_message_from_url(self, url: str) -> tuple:
         """Extract channel ID and message ID from Telegram URL"""
         try:
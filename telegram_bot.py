@@ -329,9 +329,13 @@ class ViewBoosterBot:
             await self.telethon_manager.stop_retry_manager()
             logger.info("⏹️ Retry queue manager stopped")
             
+            # Flush queued admin writes before the database goes away
+            await self.admin_handler.stop_writer()
+            
             # Stop live monitoring service
             await self.live_monitor.stop_monitoring()
             await self.telethon_manager.cleanup()
+            await self.db.flush_logs()
             await self.bot.session.close()
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")